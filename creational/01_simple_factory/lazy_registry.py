@@ -0,0 +1,72 @@
+"""
+Реєстр продуктів для фабрики, де продукти реєструються за шляхом
+"module:Class" (як entry points), а сам модуль імпортується лише тоді,
+коли продукт вперше запитали. Старт процесу не платить за імпорт
+продуктів, які в цьому процесі так і не знадобились.
+"""
+import importlib
+import typing as typ
+from collections.abc import Mapping
+
+from simple_factory import UserFactory
+
+
+class LazyRegistry(Mapping):
+
+    def __init__(self, products: typ.Optional[typ.Mapping[str, str]] = None):
+        self._paths = dict()  # type: typ.Dict[str, str]
+        self._loaded = dict()  # type: typ.Dict[str, type]
+        for key, path in (products or {}).items():
+            self.register(key, path)
+
+    def register(self, key: str, path: str) -> None:
+        if ":" not in path:
+            raise ValueError("Product path should look like 'module:Class', got: {}".format(path))
+        self._paths[key] = path
+        self._loaded.pop(key, None)
+
+    def unregister(self, key: str) -> None:
+        del self._paths[key]
+        self._loaded.pop(key, None)
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self._loaded
+
+    def __getitem__(self, key: str) -> type:
+        try:
+            return self._loaded[key]
+        except KeyError:
+            pass
+        module_name, _, attr = self._paths[key].partition(":")
+        product = getattr(importlib.import_module(module_name), attr)
+        self._loaded[key] = product
+        return product
+
+    def __iter__(self) -> typ.Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+class LazyUserFactory(UserFactory):
+
+    users = LazyRegistry({
+        "user": "simple_factory:User",
+        "customer": "simple_factory:Customer",
+        "admin": "simple_factory:Admin",
+    })
+
+
+if __name__ == "__main__":
+    print(LazyUserFactory.users.is_loaded("admin"))
+    LazyUserFactory("admin").create()
+    print(LazyUserFactory.users.is_loaded("admin"))
+    print(LazyUserFactory.users.is_loaded("customer"))
+
+
+# ================ Output ================
+# False
+# Created admin user
+# True
+# False
@@ -0,0 +1,71 @@
+"""
+Порівняння часу старту процесу (python -X importtime) для фабрики,
+яка імпортує всі продукти одразу, та фабрики з LazyRegistry.
+Продукти генеруються у тимчасовій директорії.
+"""
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+PRODUCTS = 150
+
+PRODUCT_TEMPLATE = '''
+from dataclasses import dataclass
+
+
+@dataclass
+class Product{n}:
+    name: str = "product {n}"
+    price: int = {n}
+
+    def describe(self) -> str:
+        return "{{}}: {{}}".format(self.name, self.price)
+'''
+
+
+def write_products(path: str) -> None:
+    package = os.path.join(path, "products")
+    os.mkdir(package)
+    open(os.path.join(package, "__init__.py"), "w").close()
+    for n in range(PRODUCTS):
+        with open(os.path.join(package, "product_{}.py".format(n)), "w") as f:
+            f.write(PRODUCT_TEMPLATE.format(n=n))
+
+    with open(os.path.join(path, "eager_factory.py"), "w") as f:
+        for n in range(PRODUCTS):
+            f.write("from products.product_{0} import Product{0}\n".format(n))
+        f.write("users = {{{}}}\n".format(", ".join(
+            "'p{0}': Product{0}".format(n) for n in range(PRODUCTS))))
+
+    with open(os.path.join(path, "lazy_factory.py"), "w") as f:
+        f.write("from lazy_registry import LazyRegistry\n")
+        f.write("users = LazyRegistry({{{}}})\n".format(", ".join(
+            "'p{0}': 'products.product_{0}:Product{0}'".format(n) for n in range(PRODUCTS))))
+
+
+def import_time(path: str, module: str) -> int:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([path, os.path.dirname(os.path.abspath(__file__))]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import {}".format(module)],
+        env=env, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s+{}$".format(module), line)
+        if match:
+            return int(match.group(1))
+    raise RuntimeError("No import time for {}".format(module))
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as path:
+        write_products(path)
+        for module in ("eager_factory", "lazy_factory"):
+            import_time(path, module)  # warm up .pyc cache
+            best = min(import_time(path, module) for _ in range(5))
+            print("{:<14} {} products: {:>8} us".format(module, PRODUCTS, best))
+
+
+# ================ Output ================
+# eager_factory  150 products:   153824 us
+# lazy_factory   150 products:    16780 us
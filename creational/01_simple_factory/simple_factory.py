@@ -12,50 +12,78 @@
 а какая-то логика, тогда имеет смысл создать отдельную фабрику вместо повторения
 одного и того же кода повсюду.
 """
+import typing as typ
+from types import MappingProxyType
+
+output = print
 
 
 class User:
 
     def __init__(self):
-        print("Created simple user")
+        output("Created simple user")
 
 
 class Customer:
 
     def __init__(self):
-        print("Created customer user")
+        output("Created customer user")
 
 
 class Admin:
 
     def __init__(self):
-        print("Created admin user")
+        output("Created admin user")
 
 
 class UserFactory:
 
+    users = MappingProxyType({
+        "user": User,
+        "customer": Customer,
+        "admin": Admin,
+    })
+
     def __init__(self, user_type: str):
         self.user_type = user_type
-        self.users = {
-            "user": User,
-            "customer": Customer,
-            "admin": Admin,
-        }
+        self._user = self.resolve(user_type)
 
-    def create(self):
-        user = self.users.get(self.user_type)
+    @classmethod
+    def resolve(cls, user_type: str) -> type:
+        user = cls.users.get(user_type)
         if not user:
-            Exception("Wrong user type")
-        return user()
+            raise ValueError("Wrong user type: {}".format(user_type))
+        return user
+
+    def create(self):
+        return self._user()
+
+    @classmethod
+    def create_many(cls, user_types: typ.Iterable[str]) -> list:
+        user_types = list(user_types)
+        resolved = {user_type: cls.resolve(user_type)
+                    for user_type in dict.fromkeys(user_types)}
+        return [resolved[user_type]() for user_type in user_types]
+
+    @classmethod
+    def create_batch(cls, user_type: str, n: int) -> list:
+        user = cls.resolve(user_type)
+        return [user() for _ in range(n)]
 
 
 if __name__ == "__main__":
     UserFactory("admin").create()
     UserFactory("user").create()
     UserFactory("customer").create()
+    UserFactory.create_many(["user", "admin"])
+    UserFactory.create_batch("customer", 2)
 
 
 # ================ Output ================
 # Created admin user
 # Created simple user
 # Created customer user
+# Created simple user
+# Created admin user
+# Created customer user
+# Created customer user
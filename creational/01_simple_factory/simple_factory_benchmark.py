@@ -0,0 +1,40 @@
+"""
+Порівняння створення користувачів по одному (UserFactory(...).create())
+з пакетним створенням (create_batch / create_many),
+де тип користувача визначається лише один раз.
+"""
+import io
+import timeit
+from contextlib import redirect_stdout
+
+from simple_factory import UserFactory
+
+N = 100000
+USER_TYPES = ["user", "customer", "admin"] * (N // 3)
+
+
+def per_call():
+    for user_type in USER_TYPES:
+        UserFactory(user_type).create()
+
+
+def batch():
+    for user_type in ("user", "customer", "admin"):
+        UserFactory.create_batch(user_type, N // 3)
+
+
+def many():
+    UserFactory.create_many(USER_TYPES)
+
+
+if __name__ == "__main__":
+    for func in (per_call, batch, many):
+        with redirect_stdout(io.StringIO()):
+            elapsed = min(timeit.repeat(func, number=1, repeat=5))
+        print("{:<10} {:.3f}s".format(func.__name__, elapsed))
+
+
+# ================ Output ================
+# per_call   0.168s
+# batch      0.093s
+# many       0.100s
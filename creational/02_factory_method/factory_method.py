@@ -25,13 +25,21 @@ new для створення об’єктів-продуктів. Підкла
 но необходимый подкласс динамически определяется во время выполнения.
 Иными словами, когда клиент не знает, какой именно подкласс ему может понадобиться.
 """
+import os
 import platform
+import typing as typ
 from abc import ABC, abstractmethod
+from functools import lru_cache
+
+output = print
 
 
 # ====== Buttons ======
 
 class Button:
+    __slots__ = ()
+    # stateless buttons can be shared between dialogs, mutable ones should set it to False
+    shareable = True
 
     @property
     @abstractmethod
@@ -50,6 +58,7 @@ class Button:
 
 
 class WinButton(Button):
+    __slots__ = ()
 
     @property
     def height(self) -> int:
@@ -65,6 +74,7 @@ class WinButton(Button):
 
 
 class LinuxButton(Button):
+    __slots__ = ()
 
     @property
     def height(self) -> int:
@@ -82,14 +92,25 @@ class LinuxButton(Button):
 # ====== Dialogs ======
 
 class Dialog(ABC):
+    flyweight = True
+    _buttons = dict()  # type: typ.Dict[type, Button]
 
     @abstractmethod
     def create_button(self) -> Button:
         pass
 
+    def shared(self, button_class: typ.Type[Button]) -> Button:
+        if not (self.flyweight and button_class.shareable):
+            return button_class()
+        try:
+            return self._buttons[button_class]
+        except KeyError:
+            button = self._buttons[button_class] = button_class()
+            return button
+
     def draw(self) -> None:
         button = self.create_button()
-        print("Drawing button. Height: {}, Weight: {}, Color: {}".format(
+        output("Drawing button. Height: {}, Weight: {}, Color: {}".format(
             button.height, button.weight, button.color
         ))
 
@@ -97,30 +118,51 @@ class Dialog(ABC):
 class WinDialog(Dialog):
 
     def create_button(self) -> WinButton:
-        return WinButton()
+        return self.shared(WinButton)
 
 
 class LinuxDialog(Dialog):
 
     def create_button(self) -> LinuxButton:
-        return LinuxButton()
+        return self.shared(LinuxButton)
 
 
 # ====== Application ======
 
+PLATFORM_ENV = "GUI_PLATFORM"
+
+platform_factories = {
+    "Linux": LinuxDialog,
+    "Windows": WinDialog,
+}
+
+
+# platform.system() names mapped onto the keys of platform_factories
+platform_aliases = {
+    "Darwin": "MacOS",
+}
+
+
+@lru_cache(maxsize=None)
+def detect_platform() -> str:
+    return platform.system()
+
+
+@lru_cache(maxsize=None)
+def resolve_factory(default: typ.Optional[typ.Type[Dialog]] = None) -> typ.Type[Dialog]:
+    """Result is cached, call resolve_factory.cache_clear() after changing GUI_PLATFORM"""
+    my_os = os.environ.get(PLATFORM_ENV) or detect_platform()
+    my_os = platform_aliases.get(my_os, my_os)
+    factory = platform_factories.get(my_os, default)
+    if factory is None:
+        raise ValueError("Unknown operation system: {}".format(my_os))
+    return factory
+
+
 if __name__ == "__main__":
-    platform_factories = {
-        "Linux": LinuxDialog,
-        "Windows": WinDialog,
-    }
-    my_os = platform.system()
-    print(my_os)
-
-    dialog = platform_factories.get(my_os)
-    if not dialog:
-        Exception("Unknown operation system")
-
-    dialog = dialog()
+    print(detect_platform())
+
+    dialog = resolve_factory()()
     dialog.draw()
 
 
@@ -0,0 +1,70 @@
+"""
+Малювання мільйона діалогів зі спільними (flyweight) кнопками
+та з новою кнопкою на кожне малювання: час, пік пам'яті (tracemalloc)
+і кількість зборок сміття (gc.get_stats()) під час draw(),
+а також пам'ять для мільйона кнопок, які тримає викликач.
+
+На шляху draw() виграшу немає: нова кнопка звільняється лічильником посилань
+одразу після малювання, тож пік пам'яті майже однаковий, зборок сміття немає в обох
+випадках, а час у межах шуму вимірювання. Спільні кнопки економлять пам'ять лише тоді,
+коли створені кнопки зберігаються.
+"""
+import gc
+import timeit
+import tracemalloc
+from contextlib import redirect_stdout
+
+from factory_method import LinuxDialog
+
+N = 1000000
+
+
+class NullWriter:
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+class FreshLinuxDialog(LinuxDialog):
+    flyweight = False
+
+
+def collections() -> int:
+    return sum(stats["collections"] for stats in gc.get_stats())
+
+
+def bench(dialog_class) -> None:
+    dialog = dialog_class()
+    with redirect_stdout(NullWriter()):
+        elapsed = min(timeit.repeat(dialog.draw, number=N, repeat=3))
+
+        gc.collect()
+        before = collections()
+        tracemalloc.start()
+        for _ in range(N):
+            dialog.draw()
+        _, draw_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        draw_collections = collections() - before
+    print("{:<18} draw: {:.3f}s, peak: {} B, gc collections: {}".format(
+        dialog_class.__name__, elapsed, draw_peak, draw_collections))
+
+    gc.collect()
+    tracemalloc.start()
+    buttons = [dialog.create_button() for _ in range(N)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:<18} {} kept buttons: {} distinct, {:.1f} MiB".format(
+        dialog_class.__name__, N, len(set(map(id, buttons))), size / 2 ** 20))
+
+
+if __name__ == "__main__":
+    bench(FreshLinuxDialog)
+    bench(LinuxDialog)
+
+
+# ================ Output ================
+# FreshLinuxDialog   draw: 2.032s, peak: 454 B, gc collections: 0
+# FreshLinuxDialog   1000000 kept buttons: 1000000 distinct, 38.6 MiB
+# LinuxDialog        draw: 2.010s, peak: 422 B, gc collections: 0
+# LinuxDialog        1000000 kept buttons: 1 distinct, 8.1 MiB
@@ -26,8 +26,14 @@
     Самолет + РеактивныйДвигатель + Штурвал
 Если у вас нет семейств продуктов, значит не может быть и абстрактной фабрики.
 """
+import os
 import platform
+import typing as typ
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from functools import lru_cache
+
+output = print
 
 
 # ====== Buttons ======
@@ -42,19 +48,19 @@ class Button(ABC):
 class WinButton(Button):
 
     def design(self):
-        print("Here are some instructions of how to draw windows button")
+        output("Here are some instructions of how to draw windows button")
 
 
 class LinuxButton(Button):
 
     def design(self):
-        print("Here are some instructions of how to draw linux button")
+        output("Here are some instructions of how to draw linux button")
 
 
 class MacButton(Button):
 
     def design(self):
-        print("Here are some instructions of how to draw mac button")
+        output("Here are some instructions of how to draw mac button")
 
 
 # ====== Text Areas ======
@@ -69,24 +75,74 @@ class TextArea(ABC):
 class WinTextArea(TextArea):
 
     def design(self):
-        print("Here are some instructions of how to draw windows text area")
+        output("Here are some instructions of how to draw windows text area")
 
 
 class LinuxTextArea(TextArea):
 
     def design(self):
-        print("Here are some instructions of how to draw linux text area")
+        output("Here are some instructions of how to draw linux text area")
 
 
 class MacTextArea(TextArea):
 
     def design(self):
-        print("Here are some instructions of how to draw mac text area")
+        output("Here are some instructions of how to draw mac text area")
+
+
+# ====== Pools ======
+
+class WidgetPool:
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._free = defaultdict(list)  # type: typ.DefaultDict[type, list]
+
+    def acquire(self, widget_class: type):
+        free = self._free[widget_class]
+        if free:
+            self.hits += 1
+            return free.pop()
+        self.misses += 1
+        return widget_class()
+
+    def acquire_many(self, widget_class: type, n: int) -> list:
+        free = self._free[widget_class]
+        hits = min(n, len(free))
+        widgets = free[len(free) - hits:]
+        del free[len(free) - hits:]
+        widgets.extend(widget_class() for _ in range(n - hits))
+        self.hits += hits
+        self.misses += n - hits
+        return widgets
+
+    def release(self, *widgets) -> None:
+        for widget in widgets:
+            free = self._free[type(widget)]
+            if len(free) < self.max_size:
+                free.append(widget)
+
+    def stats(self) -> typ.Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "free": sum(map(len, self._free.values())),
+        }
 
 
 # ====== Factories ======
 
 class GUIFactory(ABC):
+    family = None  # type: str
+    button_class = None  # type: typ.Type[Button]
+    text_area_class = None  # type: typ.Type[TextArea]
+    pool = None  # type: WidgetPool
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.pool = WidgetPool()
 
     @abstractmethod
     def create_button(self) -> Button:
@@ -96,37 +152,57 @@ class GUIFactory(ABC):
     def create_text_area(self) -> TextArea:
         pass
 
+    def create_buttons(self, n: int) -> typ.List[Button]:
+        output("Creating {} {} buttons".format(n, self.family))
+        return self.pool.acquire_many(self.button_class, n)
+
+    def create_text_areas(self, n: int) -> typ.List[TextArea]:
+        output("Creating {} {} text area elements".format(n, self.family))
+        return self.pool.acquire_many(self.text_area_class, n)
+
+    def release(self, *widgets) -> None:
+        self.pool.release(*widgets)
+
 
 class WinFactory(GUIFactory):
+    family = "windows"
+    button_class = WinButton
+    text_area_class = WinTextArea
 
     def create_button(self) -> WinButton:
-        print("Creating windows button")
+        output("Creating windows button")
         return WinButton()
 
     def create_text_area(self) -> WinTextArea:
-        print("Creating windows text area element")
+        output("Creating windows text area element")
         return WinTextArea()
 
 
 class LinuxFactory(GUIFactory):
+    family = "linux"
+    button_class = LinuxButton
+    text_area_class = LinuxTextArea
 
     def create_button(self) -> LinuxButton:
-        print("Creating linux button")
+        output("Creating linux button")
         return LinuxButton()
 
     def create_text_area(self) -> LinuxTextArea:
-        print("Creating linux text area element")
+        output("Creating linux text area element")
         return LinuxTextArea()
 
 
 class MacFactory(GUIFactory):
+    family = "mac"
+    button_class = MacButton
+    text_area_class = MacTextArea
 
     def create_button(self) -> MacButton:
-        print("Creating linux button")
+        output("Creating linux button")
         return MacButton()
 
     def create_text_area(self) -> MacTextArea:
-        print("Creating linux text area element")
+        output("Creating linux text area element")
         return MacTextArea()
 
 
@@ -143,26 +219,56 @@ class Application:
         self.text_area.design()
 
 
-if __name__ == "__main__":
-    platform_factories = {
-        "Linux": LinuxFactory,
-        "Windows": WinFactory,
-        "MacOS": MacFactory,
-    }
-    my_os = platform.system()
+PLATFORM_ENV = "GUI_PLATFORM"
+
+platform_factories = {
+    "Linux": LinuxFactory,
+    "Windows": WinFactory,
+    "MacOS": MacFactory,
+}
+
 
-    os_factory = platform_factories.get(my_os)
-    if not os_factory:
-        Exception("Unknown operation system")
+# platform.system() names mapped onto the keys of platform_factories
+platform_aliases = {
+    "Darwin": "MacOS",
+}
 
-    os_factory = os_factory()
+
+@lru_cache(maxsize=None)
+def detect_platform() -> str:
+    return platform.system()
+
+
+@lru_cache(maxsize=None)
+def resolve_factory(default: typ.Optional[typ.Type[GUIFactory]] = None) -> typ.Type[GUIFactory]:
+    """Result is cached, call resolve_factory.cache_clear() after changing GUI_PLATFORM"""
+    my_os = os.environ.get(PLATFORM_ENV) or detect_platform()
+    my_os = platform_aliases.get(my_os, my_os)
+    factory = platform_factories.get(my_os, default)
+    if factory is None:
+        raise ValueError("Unknown operation system: {}".format(my_os))
+    return factory
+
+
+if __name__ == "__main__":
+    os_factory = resolve_factory()()
 
     app = Application(os_factory)
     app.draw()
 
+    buttons = os_factory.create_buttons(3)
+    os_factory.release(*buttons)
+    os_factory.create_buttons(2)
+    os_factory.create_text_areas(2)
+    print(os_factory.pool.stats())
+
 
 # ================ Output ================
 # Creating linux button
 # Creating linux text area element
 # Here are some instructions of how to draw linux button
 # Here are some instructions of how to draw linux text area
+# Creating 3 linux buttons
+# Creating 2 linux buttons
+# Creating 2 linux text area elements
+# {'hits': 2, 'misses': 5, 'free': 1}
@@ -0,0 +1,137 @@
+"""
+Записані плани побудови для Директора.
+Рецепт директора (наприклад Director.build_car_with_sport_engine) виконується
+один раз на будівельнику, що лише записує виклики, і стає планом побудови.
+Готовий продукт кешується для пари (рецепт, клас будівельника),
+а наступні продукти — це дешеві копії закешованого.
+
+Кеш обмежений (LRU) і скидає продукт, якщо будь-який атрибут класу будівельника
+або його батьківських класів було змінено.
+
+Рецепт записується на RecordingBuilder, тому він не повинен розгалужуватися
+залежно від будівельника: усі класи будівельників отримають той самий план.
+"""
+import copy
+import typing as typ
+from collections import OrderedDict
+
+from builder import Builder, BuilderMeta, CarBuilder, CarManualBuilder, Director
+
+Recipe = typ.Callable[[Builder], None]
+Step = typ.Tuple[str, tuple]
+
+
+class RecordingBuilder(Builder):
+
+    def __init__(self):
+        self.steps = list()  # type: typ.List[Step]
+
+    @property
+    def product(self) -> None:
+        return None
+
+    def set_engine(self, name: str):
+        self.steps.append(("set_engine", (name, )))
+
+    def set_seats(self, number: int):
+        self.steps.append(("set_seats", (number, )))
+
+
+class BuildPlan:
+
+    def __init__(self, steps: typ.Iterable[Step]):
+        self.steps = tuple(steps)
+
+    @classmethod
+    def record(cls, recipe: Recipe) -> "BuildPlan":
+        """The recipe only sees a RecordingBuilder, so it must not branch on the builder"""
+        builder = RecordingBuilder()
+        recipe(builder)
+        return cls(builder.steps)
+
+    def replay(self, builder: Builder):
+        for name, args in self.steps:
+            getattr(builder, name)(*args)
+        return builder.product
+
+    @staticmethod
+    def fingerprint(builder_class: typ.Type[Builder]) -> tuple:
+        # the whole class matters, not only the steps: product, __init__, helpers
+        return tuple((klass, tuple(vars(klass).items()))
+                     for klass in builder_class.__mro__ if klass is not object)
+
+
+class PlanCache:
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._plans = OrderedDict()  # type: typ.Dict[Recipe, BuildPlan]
+        # (recipe, builder class) -> (builder generation, fingerprint, product)
+        self._products = OrderedDict()  # type: typ.Dict[tuple, tuple]
+
+    def plan(self, recipe: Recipe) -> BuildPlan:
+        try:
+            self._plans.move_to_end(recipe)
+            return self._plans[recipe]
+        except KeyError:
+            plan = self._plans[recipe] = BuildPlan.record(recipe)
+            self._evict(self._plans)
+            return plan
+
+    def build(self, recipe: Recipe, builder_class: typ.Type[Builder]):
+        key = (recipe, builder_class)
+        cached = self._products.get(key)
+        if cached is not None and cached[0] != BuilderMeta.generation:
+            # some builder class was changed since, compare the whole class only now
+            if cached[1] == BuildPlan.fingerprint(builder_class):
+                cached = self._products[key] = (BuilderMeta.generation, ) + cached[1:]
+            else:
+                cached = None
+        if cached is not None:
+            self.hits += 1
+            self._products.move_to_end(key)
+            product = cached[2]
+        else:
+            self.misses += 1
+            product = self.plan(recipe).replay(builder_class())
+            self._products[key] = (BuilderMeta.generation, BuildPlan.fingerprint(builder_class), product)
+            self._products.move_to_end(key)
+            self._evict(self._products)
+        return product.copy() if hasattr(product, "copy") else copy.deepcopy(product)
+
+    def clear(self) -> None:
+        self._plans.clear()
+        self._products.clear()
+
+    def _evict(self, cache: OrderedDict) -> None:
+        while len(cache) > self.maxsize:
+            cache.popitem(last=False)
+
+
+if __name__ == '__main__':
+    cache = PlanCache(maxsize=16)
+
+    print(cache.plan(Director.build_car_with_10_seats).steps)
+    cache.build(Director.build_car_with_10_seats, CarBuilder).get_parts()
+    cache.build(Director.build_car_with_10_seats, CarBuilder).get_parts()
+    cache.build(Director.build_car_with_10_seats, CarManualBuilder).get_parts()
+
+    class TunedCarBuilder(CarBuilder):
+        pass
+
+    cache.build(Director.build_car_with_sport_engine, TunedCarBuilder).get_parts()
+    TunedCarBuilder.set_seats = lambda self, number: self._car.add("Set {} Sport Seats".format(number))
+    cache.build(Director.build_car_with_sport_engine, TunedCarBuilder).get_parts()
+    print(cache.hits, cache.misses)
+
+
+# ================ Output ================
+# (('set_engine', ('Big one',)), ('set_seats', (10,)))
+# Car parts: ['Set Big one Engine', 'Set 10 Seats']
+# Car parts: ['Set Big one Engine', 'Set 10 Seats']
+# Manual parts: ['The car have a very insatiable engine. You should by more fuel', 'There are many doors in the car']
+# Car parts: ['Set Sport Engine', 'Set 2 Seats']
+# Car parts: ['Set Sport Engine', 'Set 2 Sport Seats']
+# 1 4
@@ -0,0 +1,34 @@
+"""
+Швидкість отримання 100 000 продуктів за рецептом директора:
+виконання рецепта на новому будівельнику щоразу проти копій з PlanCache.
+"""
+import timeit
+
+from build_plan import PlanCache
+from builder import CarBuilder, CarManualBuilder, Director
+
+N = 100000
+
+
+def direct(recipe, builder_class):
+    builder = builder_class()
+    recipe(builder)
+    return builder.product
+
+
+if __name__ == "__main__":
+    cache = PlanCache()
+    recipe = Director.build_car_with_sport_engine
+    for builder_class in (CarBuilder, CarManualBuilder):
+        for name, build in (("recipe", direct), ("PlanCache", cache.build)):
+            elapsed = min(timeit.repeat(lambda: build(recipe, builder_class), number=N, repeat=5))
+            print("{:<16} {:<9} {:.3f}s".format(builder_class.__name__, name, elapsed))
+    print("hits: {}, misses: {}".format(cache.hits, cache.misses))
+
+
+# ================ Output ================
+# CarBuilder       recipe    0.253s
+# CarBuilder       PlanCache 0.083s
+# CarManualBuilder recipe    0.160s
+# CarManualBuilder PlanCache 0.097s
+# hits: 999998, misses: 2
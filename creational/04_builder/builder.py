@@ -16,7 +16,9 @@
     Клієнт буде прив’язаний до конкретних класів будівельників,
         тому що в інтерфейсі будівельника може не бути методу отримання результату.
 """
-from abc import ABC, abstractmethod
+from abc import ABCMeta, abstractmethod
+
+output = print
 
 
 class Car:
@@ -28,7 +30,12 @@ class Car:
         self.parts.append(part)
 
     def get_parts(self):
-        print("Car parts: {}".format(self.parts))
+        output("Car parts: {}".format(self.parts))
+
+    def copy(self) -> "Car":
+        product = Car()
+        product.parts = list(self.parts)
+        return product
 
 
 class Manual:
@@ -40,10 +47,29 @@ class Manual:
         self.parts.append(part)
 
     def get_parts(self):
-        print("Manual parts: {}".format(self.parts))
+        output("Manual parts: {}".format(self.parts))
+
+    def copy(self) -> "Manual":
+        product = Manual()
+        product.parts = list(self.parts)
+        return product
+
+
+class BuilderMeta(ABCMeta):
+    """Counts changes of builder classes, so a cache of built products
+    only has to compare one number while no builder class was changed"""
+    generation = 0
+
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        BuilderMeta.generation += 1
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        BuilderMeta.generation += 1
 
 
-class Builder(ABC):
+class Builder(metaclass=BuilderMeta):
 
     @property
     @abstractmethod
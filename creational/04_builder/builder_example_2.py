@@ -5,9 +5,13 @@ This design pattern comes under the category of creational pattern.
 In this design pattern, a builder class builds the final object in step-by-step procedure.
 This builder is independent of other objects.
 """
-from collections import namedtuple
+import typing as typ
+from collections import namedtuple, deque
+from concurrent.futures import ProcessPoolExecutor
 from abc import ABC, abstractmethod
 
+output = print
+
 
 Wheel = namedtuple('Wheel', ('size', ))
 Engine = namedtuple('Engine', ('horsepower', ))
@@ -30,9 +34,32 @@ class Car:
         self.__engine = engine
 
     def specification(self):
-        print("body: %s" % self.__body.shape)
-        print("engine horsepower: %d" % self.__engine.horsepower)
-        print("tire size: %d\'" % self.__wheels[0].size)
+        output("body: %s" % self.__body.shape)
+        output("engine horsepower: %d" % self.__engine.horsepower)
+        output("tire size: %d\'" % self.__wheels[0].size)
+
+
+class SlottedCar:
+    __slots__ = ("wheels", "engine", "body")
+
+    def __init__(self):
+        self.wheels = list()
+        self.engine = None
+        self.body = None
+
+    def set_body(self, body: Body):
+        self.body = body
+
+    def attach_wheel(self, wheel: Wheel):
+        self.wheels.append(wheel)
+
+    def set_engine(self, engine: Engine):
+        self.engine = engine
+
+    def specification(self):
+        output("body: %s" % self.body.shape)
+        output("engine horsepower: %d" % self.engine.horsepower)
+        output("tire size: %d\'" % self.wheels[0].size)
 
 
 class Builder(ABC):
@@ -70,14 +97,36 @@ class PassengerBuilder(Builder):
         return Body(shape="simple one")
 
 
+class InterningBuilder(Builder):
+    """Returns one shared instance for equal immutable parts of the wrapped builder"""
+
+    def __init__(self, builder: Builder):
+        self.builder = builder
+        self._parts = dict()  # type: typ.Dict[tuple, tuple]
+
+    def intern(self, part):
+        # namedtuples compare as plain tuples, so Wheel(22) == Engine(22) without the type
+        return self._parts.setdefault((type(part), part), part)
+
+    def get_wheel(self) -> Wheel:
+        return self.intern(self.builder.get_wheel())
+
+    def get_engine(self) -> Engine:
+        return self.intern(self.builder.get_engine())
+
+    def get_body(self) -> Body:
+        return self.intern(self.builder.get_body())
+
+
 class Director:
     __builder = None
+    car_class = Car  # type: typ.Type[typ.Union[Car, SlottedCar]]
 
     def set_builder(self, builder: Builder) -> None:
         self.__builder = builder
 
     def get_car(self) -> Car:
-        car = Car()
+        car = self.car_class()
         car.set_body(self.__builder.get_body())
         car.set_engine(self.__builder.get_engine())
         for _ in range(4):
@@ -85,6 +134,44 @@ class Director:
 
         return car
 
+    def get_cars(self, n: int, builder: typ.Optional[Builder] = None,
+                 workers: typ.Optional[int] = None, chunksize: int = 1000) -> typ.Iterator[Car]:
+        """Builds n cars in chunks, fanned out over a process pool when workers > 1"""
+        builder = builder or self.__builder
+        if builder is None:
+            raise ValueError("No builder: pass one or call set_builder() first")
+        if n < 0:
+            raise ValueError("Number of cars can not be negative: {}".format(n))
+        if chunksize < 1:
+            raise ValueError("Chunk size should be at least 1: {}".format(chunksize))
+        # a generator would only check the arguments on its first next()
+        return self._build_cars(n, builder, workers, chunksize)
+
+    def _build_cars(self, n: int, builder: Builder,
+                    workers: typ.Optional[int], chunksize: int) -> typ.Iterator[Car]:
+        sizes = [chunksize] * (n // chunksize) + ([n % chunksize] if n % chunksize else [])
+        if not workers or workers == 1:
+            for size in sizes:
+                yield from build_chunk(builder, size, self.car_class)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # only a couple of chunks per worker are in flight, so memory stays flat
+            pending = deque()
+            for size in sizes:
+                pending.append(pool.submit(build_chunk, builder, size, self.car_class))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+def build_chunk(builder: Builder, size: int, car_class: type = Car) -> typ.List[Car]:
+    director = Director()
+    director.car_class = car_class
+    director.set_builder(builder)
+    return [director.get_car() for _ in range(size)]
+
 
 if __name__ == "__main__":
     director = Director()
@@ -101,6 +188,10 @@ if __name__ == "__main__":
     passenger = director.get_car()
     passenger.specification()
 
+    print("\nFleet")
+    fleet = director.get_cars(5000, jeep_builder, workers=2)
+    print(sum(1 for _ in fleet))
+
 
 # ================ Output ================
 # Jeep
@@ -112,3 +203,6 @@ if __name__ == "__main__":
 # body: simple one
 # engine horsepower: 200
 # tire size: 18'
+#
+# Fleet
+# 5000
@@ -0,0 +1,39 @@
+"""
+Scaling of Director.get_cars() across 1, 2, 4 and 8 worker processes
+for a builder with CPU heavy parts. Worker counts above os.cpu_count()
+can not show any scaling, so they are skipped and the output says so.
+"""
+import hashlib
+import os
+import time
+
+from builder_example_2 import Director, Engine, JeepBuilder
+
+N = 4000
+
+
+class HeavyJeepBuilder(JeepBuilder):
+
+    def get_engine(self) -> Engine:
+        digest = b"engine"
+        for _ in range(1000):
+            digest = hashlib.sha256(digest).digest()
+        return Engine(horsepower=400 + digest[0])
+
+
+if __name__ == "__main__":
+    cpus = os.cpu_count() or 1
+    skipped = [workers for workers in (1, 2, 4, 8) if workers > cpus]
+    print("cpus: {}, skipped worker counts above it: {}".format(cpus, skipped or "none"))
+    director = Director()
+    for workers in (1, 2, 4, 8):
+        if workers in skipped:
+            continue
+        start = time.perf_counter()
+        built = sum(1 for _ in director.get_cars(N, HeavyJeepBuilder(), workers=workers, chunksize=100))
+        print("workers: {}, cars: {}, {:.3f}s".format(workers, built, time.perf_counter() - start))
+
+
+# ================ Output ================
+# cpus: 1, skipped worker counts above it: [2, 4, 8]
+# workers: 1, cars: 4000, 2.871s
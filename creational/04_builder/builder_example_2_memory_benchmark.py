@@ -0,0 +1,33 @@
+"""
+Memory (tracemalloc) of a 1M car fleet: plain Car with fresh parts
+versus SlottedCar with parts shared through InterningBuilder.
+"""
+import gc
+import tracemalloc
+
+from builder_example_2 import Car, Director, InterningBuilder, JeepBuilder, SlottedCar
+
+N = 1000000
+
+
+def bench(name: str, car_class: type, builder) -> None:
+    director = Director()
+    director.car_class = car_class
+    gc.collect()
+    tracemalloc.start()
+    fleet = list(director.get_cars(N, builder))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:<28} {:7.1f} MiB for {} cars".format(name, size / 2 ** 20, len(fleet)))
+
+
+if __name__ == "__main__":
+    bench("Car", Car, JeepBuilder())
+    bench("Car + interned parts", Car, InterningBuilder(JeepBuilder()))
+    bench("SlottedCar + interned parts", SlottedCar, InterningBuilder(JeepBuilder()))
+
+
+# ================ Output ================
+# Car                            504.0 MiB for 1000000 cars
+# Car + interned parts           183.5 MiB for 1000000 cars
+# SlottedCar + interned parts    145.4 MiB for 1000000 cars
@@ -0,0 +1,120 @@
+"""
+Компактне представлення автомобіля для Будівельника.
+Кожна унікальна деталь форматується лише один раз і зберігається
+в спільній таблиці деталей, а автомобіль тримає тільки масив кодів деталей.
+Рядки деталей збираються ліниво, коли їх дійсно запитали.
+
+Будівельник може повторно використовувати автомобілі:
+повернений через recycle() автомобіль очищується і стає наступним продуктом.
+"""
+import typing as typ
+from array import array
+
+from builder import Builder
+
+output = print
+
+
+class PartTable:
+
+    def __init__(self):
+        self._codes = dict()  # type: typ.Dict[typ.Tuple[str, type, typ.Any], int]
+        self._parts = list()  # type: typ.List[str]
+
+    def code(self, template: str, value: typ.Any = None) -> int:
+        # 1, 1.0 and True are equal keys, but are formatted differently
+        key = (template, type(value), value)
+        try:
+            return self._codes[key]
+        except KeyError:
+            self._parts.append(template if value is None else template.format(value))
+            code = self._codes[key] = len(self._parts) - 1
+            return code
+
+    def render(self, codes: typ.Iterable[int]) -> typ.List[str]:
+        parts = self._parts
+        return [parts[code] for code in codes]
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+
+PARTS = PartTable()
+
+
+class CompactCar:
+    __slots__ = ("codes", )
+
+    def __init__(self):
+        self.codes = array("I")
+
+    def add(self, part: str):
+        self.codes.append(PARTS.code(part))
+
+    def add_code(self, code: int):
+        self.codes.append(code)
+
+    def reset(self):
+        del self.codes[:]
+
+    def copy(self) -> "CompactCar":
+        car = CompactCar()
+        car.codes = array("I", self.codes)
+        return car
+
+    @property
+    def parts(self) -> typ.List[str]:
+        return PARTS.render(self.codes)
+
+    def get_parts(self):
+        output("Car parts: {}".format(self.parts))
+
+
+class CompactCarBuilder(Builder):
+
+    def __init__(self, reuse: bool = False):
+        self.reuse = reuse
+        self._free = list()  # type: typ.List[CompactCar]
+        self._car = CompactCar()
+
+    @property
+    def product(self) -> CompactCar:
+        car = self._car
+        self._car = self._free.pop() if self._free else CompactCar()
+        return car
+
+    def recycle(self, car: CompactCar):
+        if self.reuse:
+            car.reset()
+            self._free.append(car)
+
+    def set_engine(self, name):
+        self._car.add_code(PARTS.code("Set {} Engine", name))
+
+    def set_seats(self, number: int):
+        self._car.add_code(PARTS.code("Set {} Seats", number))
+
+
+if __name__ == '__main__':
+    from builder import Director
+
+    builder = CompactCarBuilder(reuse=True)
+
+    Director.build_car_with_10_seats(builder)
+    car = builder.product
+    car.get_parts()
+    builder.recycle(car)
+
+    Director.build_car_with_sport_engine(builder)
+    builder.product.get_parts()
+    Director.build_car_only_with_seats(builder)
+    seats_car = builder.product
+    seats_car.get_parts()
+    print(seats_car is car, len(PARTS))
+
+
+# ================ Output ================
+# Car parts: ['Set Big one Engine', 'Set 10 Seats']
+# Car parts: ['Set Sport Engine', 'Set 2 Seats']
+# Car parts: ['Set 4 Seats']
+# True 5
@@ -0,0 +1,54 @@
+"""
+Пам'ять (tracemalloc) та час побудови флоту автомобілів:
+список рядків (CarBuilder) проти масиву кодів деталей (CompactCarBuilder).
+"""
+import gc
+import time
+import tracemalloc
+
+from builder import CarBuilder, Director
+from compact_builder import CompactCarBuilder
+
+N = 300000
+
+
+def build_fleet(builder) -> list:
+    recipes = (Director.build_car_with_sport_engine,
+               Director.build_car_with_10_seats,
+               Director.build_car_only_with_seats)
+    fleet = []
+    for i in range(N):
+        recipes[i % 3](builder)
+        fleet.append(builder.product)
+    return fleet
+
+
+def build_recycled(builder: CompactCarBuilder) -> None:
+    for _ in range(N):
+        Director.build_car_with_sport_engine(builder)
+        builder.recycle(builder.product)
+
+
+def bench(name: str, func, builder) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    fleet = func(builder)
+    elapsed = time.perf_counter() - start
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del fleet
+    print("{:<24} {:.3f}s, kept: {:6.1f} MiB, peak: {:6.1f} MiB".format(
+        name, elapsed, size / 2 ** 20, peak / 2 ** 20))
+
+
+if __name__ == "__main__":
+    bench("CarBuilder", build_fleet, CarBuilder())
+    bench("CompactCarBuilder", build_fleet, CompactCarBuilder())
+    bench("CompactCarBuilder reuse", build_recycled, CompactCarBuilder(reuse=True))
+
+
+# ================ Output ================
+# CarBuilder               2.587s, kept:   80.4 MiB, peak:   80.4 MiB
+# CompactCarBuilder        1.779s, kept:   41.4 MiB, peak:   41.4 MiB
+# CompactCarBuilder reuse  1.030s, kept:    0.0 MiB, peak:    0.0 MiB
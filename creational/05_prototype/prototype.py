@@ -16,6 +16,132 @@
     Складно клонувати складові об’єкти, що мають посилання на інші об’єкти.
 """
 import copy
+import typing as typ
+from array import array
+
+IMMUTABLE_TYPES = (int, float, complex, str, bytes, bool, type(None), frozenset)
+SHALLOW_CONTAINERS = (list, dict, set, bytearray)
+
+
+def is_immutable(value) -> bool:
+    if isinstance(value, tuple):
+        return all(is_immutable(item) for item in value)
+    return isinstance(value, IMMUTABLE_TYPES)
+
+
+def apply_overrides(clone, attr: dict):
+    # the same rule for every strategy: overrides go through setattr, so property setters run
+    for field, value in attr.items():
+        setattr(clone, field, value)
+    return clone
+
+
+def shallow_clone(obj, attr: dict):
+    clone = object.__new__(type(obj))
+    clone.__dict__ = obj.__dict__.copy()
+    return apply_overrides(clone, attr)
+
+
+def deep_clone(obj, attr: dict):
+    return apply_overrides(copy.deepcopy(obj), attr)
+
+
+def fieldwise_cloner(container_fields: typ.Tuple[str, ...]) -> typ.Callable:
+    def clone(obj, attr: dict):
+        state = obj.__dict__.copy()
+        for field in container_fields:
+            state[field] = state[field].copy()
+        new = object.__new__(type(obj))
+        new.__dict__ = state
+        return apply_overrides(new, attr)
+    return clone
+
+
+def restore(cls: type, state: dict):
+    obj = object.__new__(cls)
+    obj.__dict__.update(state)
+    return obj
+
+
+def cow_cloner(prototype) -> typ.Callable:
+    """Clones are instances of a generated CopyOnWrite<Class> subclass which reads
+    the immutable fields it does not have from the prototype, so a clone only stores
+    the fields set on it. Pickling and copying a clone give a plain instance of the class"""
+    prototype_class = type(prototype)
+    state = prototype.__dict__
+    shared = frozenset(field for field, value in state.items()
+                       if is_immutable(value) and not hasattr(prototype_class, field))
+    own_fields = tuple(field for field in state if field not in shared)
+
+    def __getattr__(self, name: str):
+        # read at access time, like the other strategies read the prototype at clone time
+        if name in shared:
+            return state[name]
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+
+    def __reduce_ex__(self, protocol):
+        return restore, (prototype_class, dict({field: state[field] for field in shared}, **self.__dict__))
+
+    name = "CopyOnWrite" + prototype_class.__name__
+    cow_class = type(name, (prototype_class, ), dict(
+        __getattr__=__getattr__, __reduce_ex__=__reduce_ex__, __module__=prototype_class.__module__))
+
+    def clone(obj, attr: dict):
+        # setattr keeps the values inline, touching new.__dict__ would allocate a full dict
+        new = object.__new__(cow_class)
+        for field in own_fields:
+            setattr(new, field, copy.deepcopy(obj.__dict__[field]))
+        return apply_overrides(new, attr)
+    return clone
+
+
+def snapshot(obj):
+    """Deep copy of obj. Plain objects are rebuilt field by field, since the dict
+    made by deepcopy is bigger and every shallow copy of it would be bigger too"""
+    copied = copy.deepcopy(obj)
+    cls = type(obj)
+    state = getattr(copied, "__dict__", None)
+    if state is None or hasattr(obj, "__deepcopy__") or cls.__new__ is not object.__new__ \
+            or cls.__setattr__ is not object.__setattr__ \
+            or any(hasattr(cls, field) for field in state):
+        return copied
+    rebuilt = object.__new__(cls)
+    for field, value in state.items():
+        setattr(rebuilt, field, value)
+    return rebuilt
+
+
+def is_flat_container(value) -> bool:
+    if not isinstance(value, SHALLOW_CONTAINERS):
+        return False
+    items = value.items() if isinstance(value, dict) else value
+    return all(is_immutable(item) for item in items)
+
+
+def make_cloner(obj, strategy: typ.Optional[str] = None) -> typ.Callable:
+    """Picks the cheapest clone function for the current state of obj,
+    unless the strategy ('shallow', 'fieldwise', 'cow' or 'deep') is given explicitly"""
+    state = getattr(obj, "__dict__", None)
+    if strategy is None:
+        if state is None or hasattr(obj, "__deepcopy__") or type(obj).__new__ is not object.__new__:
+            strategy = "deep"
+        elif all(is_immutable(value) for value in state.values()):
+            strategy = "shallow"
+        elif all(is_immutable(value) or is_flat_container(value) for value in state.values()):
+            strategy = "fieldwise"
+        else:
+            strategy = "deep"
+
+    if strategy == "shallow":
+        return shallow_clone
+    if strategy == "fieldwise":
+        return fieldwise_cloner(tuple(
+            field for field, value in state.items() if not is_immutable(value)))
+    if strategy == "cow":
+        return cow_cloner(obj)
+    if strategy == "deep":
+        return deep_clone
+    raise ValueError("Unknown clone strategy: {}".format(strategy))
 
 
 class Shape:
@@ -93,23 +219,102 @@ class Rectangle(Shape):
         self._radius = value
 
 
+def to_column(values: typ.Iterable) -> typ.Sequence:
+    if hasattr(values, "dtype"):
+        return values  # NumPy arrays are already array-backed
+    values = list(values)
+    if all(type(value) is int for value in values):
+        try:
+            return array("q", values)
+        except OverflowError:
+            return values
+    if all(type(value) in (int, float) for value in values):
+        return array("d", values)
+    return values
+
+
+class ShapeColumns:
+    """Column-wise storage of many clones of one prototype, rows are materialised on access"""
+
+    def __init__(self, prototype, cloner: typ.Callable, columns: typ.Dict[str, typ.Sequence]):
+        self.prototype = prototype
+        self.columns = {field: to_column(values) for field, values in columns.items()}
+        self._cloner = cloner
+        self._size = len(next(iter(self.columns.values())))
+        # overrides go through setattr, so only plain fields are sure to write just themselves
+        self._plain_overrides = not any(hasattr(type(prototype), field) for field in self.columns)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, field: str) -> typ.Sequence:
+        if self._plain_overrides:
+            if field in self.columns:
+                return self.columns[field]
+            if field in vars(self.prototype) and not hasattr(type(self.prototype), field):
+                return [vars(self.prototype)[field]] * self._size
+        # a property setter of an override may write any field, read it from every row
+        return [getattr(row, field) for row in self]
+
+    def __getitem__(self, index: int):
+        row = dict()
+        for field, values in self.columns.items():
+            value = values[index]
+            row[field] = value.item() if hasattr(value, "item") else value
+        return self._cloner(self.prototype, row)
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield self[index]
+
+
 class Prototype:
     def __init__(self):
         self.objects = dict()
+        self.cloners = dict()
 
-    def register(self, identifier, obj):
-        self.objects[identifier] = obj
+    def register(self, identifier, obj, strategy: typ.Optional[str] = None):
+        """Registers a deep copy of obj: clones have the state obj had at registration,
+        later changes of obj are not seen, register it again to pick them up.
+        Every strategy clones the registered copy, cow clones read its fields on access.
+        The strategy is chosen for that copy, so it stays valid for every clone"""
+        registered = snapshot(obj)
+        self.cloners[identifier] = make_cloner(registered, strategy)
+        self.objects[identifier] = registered
 
     def unregister(self, identifier):
         del self.objects[identifier]
+        del self.cloners[identifier]
 
     def clone(self, identifier, **attr):
+        """Overrides are set on the clone with setattr, whatever the strategy,
+        so both clone(1, x=20) and clone(1, _x=20) give a clone with x == 20"""
         found = self.objects.get(identifier)
         if not found:
             raise ValueError('Incorrect object identifier:{}'.format(identifier))
-        obj = copy.deepcopy(found)
-        obj.__dict__.update(attr)
-        return obj
+        return self.cloners[identifier](found, attr)
+
+    def clone_many(self, identifier, columnar: bool = False, **columns):
+        """Clones the prototype once per row of the override columns, e.g. _x=[1, 2], _y=[3, 4].
+        Every row goes through the registered cloner like clone() does,
+        columnar=True returns ShapeColumns instead of separate objects"""
+        found = self.objects.get(identifier)
+        if not found:
+            raise ValueError('Incorrect object identifier:{}'.format(identifier))
+        if not columns:
+            raise ValueError('At least one override column is required')
+        columns = {field: values if hasattr(values, "__len__") else list(values)
+                   for field, values in columns.items()}
+        if len({len(values) for values in columns.values()}) > 1:
+            raise ValueError('Override columns should have the same length')
+
+        cloner = self.cloners[identifier]
+        if columnar:
+            return ShapeColumns(found, cloner, columns)
+        fields = tuple(columns)
+        rows = zip(*(values.tolist() if hasattr(values, "tolist") else values
+                     for values in columns.values()))
+        return [cloner(found, dict(zip(fields, row))) for row in rows]
 
 
 if __name__ == '__main__':
@@ -127,7 +332,23 @@ if __name__ == '__main__':
     circle2.y = 20
     print(circle1, circle2, sep='\n')
 
+    prototype.register(2, circle1, strategy="cow")
+    circle3 = prototype.clone(2, x=30)
+    print(circle3, circle3.__dict__, sep='\n')
+
+    for circle in prototype.clone_many(1, _x=[1, 2], _y=[3, 4]):
+        print(circle)
+    grid = prototype.clone_many(1, columnar=True, _x=range(3), _y=[0.5, 1.5, 2.5])
+    print(len(grid), grid.column("_x"), grid.column("_y"), grid.column("_height"), grid.column("x"))
+    print(grid[2])
+
 
 # ================ Output ================
 # Circle. X: 10, Y: 10, Height: 50, Width: 300
 # Circle. X: 20, Y: 20, Height: 50, Width: 300
+# Circle. X: 30, Y: 10, Height: 50, Width: 300
+# {'_x': 30}
+# Circle. X: 1, Y: 3, Height: 50, Width: 300
+# Circle. X: 2, Y: 4, Height: 50, Width: 300
+# 3 array('q', [0, 1, 2]) array('d', [0.5, 1.5, 2.5]) [50, 50, 50] [0, 1, 2]
+# Circle. X: 2, Y: 2.5, Height: 50, Width: 300
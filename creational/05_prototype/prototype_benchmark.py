@@ -0,0 +1,64 @@
+"""
+Швидкість клонування для різних стратегій Prototype.clone()
+та для пакетного Prototype.clone_many().
+Перевизначення застосовуються однаково (через setattr) для всіх стратегій.
+"""
+import timeit
+
+from prototype import Circle, Prototype, Rectangle
+
+N = 200000
+
+
+class TaggedRectangle(Rectangle):
+
+    def __init__(self):
+        super().__init__()
+        self.tags = ["red", "big"]
+
+
+def make_circle() -> Circle:
+    circle = Circle()
+    circle.x, circle.y, circle.height, circle.width = 10, 10, 50, 300
+    return circle
+
+
+def make_rectangle() -> TaggedRectangle:
+    rectangle = TaggedRectangle()
+    rectangle.x, rectangle.y, rectangle.radius = 10, 10, 5
+    return rectangle
+
+
+if __name__ == "__main__":
+    prototype = Prototype()
+    cases = (
+        ("Circle", make_circle, ("deep", "shallow", "cow")),
+        ("TaggedRectangle", make_rectangle, ("deep", "fieldwise")),
+    )
+    for name, make, strategies in cases:
+        for strategy in strategies:
+            prototype.register(name, make(), strategy=strategy)
+            elapsed = min(timeit.repeat(lambda: prototype.clone(name, x=20), number=N, repeat=3))
+            print("{:<16} {:<10} {:>10.0f} clones/s".format(name, strategy, N / elapsed))
+
+    prototype.register("grid", make_circle())
+    xs, ys = list(range(N)), [i % 100 for i in range(N)]
+    batches = (
+        ("clone loop", lambda: [prototype.clone("grid", _x=x, _y=y) for x, y in zip(xs, ys)]),
+        ("clone_many", lambda: prototype.clone_many("grid", _x=xs, _y=ys)),
+        ("columnar", lambda: prototype.clone_many("grid", columnar=True, _x=xs, _y=ys)),
+    )
+    for name, batch in batches:
+        elapsed = min(timeit.repeat(batch, number=1, repeat=3))
+        print("{:<27} {:>10.0f} clones/s".format(name, N / elapsed))
+
+
+# ================ Output ================
+# Circle           deep            89005 clones/s
+# Circle           shallow        731282 clones/s
+# Circle           cow            827771 clones/s
+# TaggedRectangle  deep            78343 clones/s
+# TaggedRectangle  fieldwise      553440 clones/s
+# clone loop                      573612 clones/s
+# clone_many                      465389 clones/s
+# columnar                       5668287 clones/s
@@ -0,0 +1,35 @@
+"""
+Пам'ять (tracemalloc) для 1M клонів одного Circle, які відрізняються лише x та y:
+повні копії стану проти клонів з копіюванням при записі (copy-on-write).
+"""
+import gc
+import tracemalloc
+
+from prototype import Circle, Prototype
+
+N = 1000000
+
+
+def bench(strategy: str) -> None:
+    circle = Circle()
+    circle.x, circle.y, circle.height, circle.width = 10, 10, 50, 300
+    circle.color = "Blue"
+    prototype = Prototype()
+    prototype.register("circle", circle, strategy=strategy)
+
+    gc.collect()
+    tracemalloc.start()
+    clones = [prototype.clone("circle", _x=i, _y=i) for i in range(N)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:<8} {:6.1f} MiB for {} clones".format(strategy, size / 2 ** 20, len(clones)))
+
+
+if __name__ == "__main__":
+    for strategy in ("shallow", "cow"):
+        bench(strategy)
+
+
+# ================ Output ================
+# shallow   206.4 MiB for 1000000 clones
+# cow       122.5 MiB for 1000000 clones
@@ -0,0 +1,71 @@
+"""
+Одинак для asyncio-сервісів з асинхронною ініціалізацією.
+Перший `await AsyncDatabase.instance(...)` запускає ініціалізацію,
+а всі одночасні виклики чекають на той самий future,
+тому з'єднання відкривається рівно один раз.
+Якщо ініціалізація впала, наступний виклик спробує ще раз.
+"""
+import asyncio
+
+from singleton import Connection
+
+
+class AsyncSingleton:
+
+    _future = None  # type: asyncio.Future
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._future = None
+
+    async def initialize(self, *args, **kwargs) -> None:
+        pass
+
+    @classmethod
+    async def instance(cls, *args, **kwargs):
+        future = cls._future
+        if future is None:
+            future = cls._future = asyncio.ensure_future(cls._create(*args, **kwargs))
+        try:
+            # shield: a cancelled awaiter should not cancel initialization for the others
+            return await asyncio.shield(future)
+        except BaseException:
+            if future.done() and cls._future is future and (future.cancelled() or future.exception()):
+                cls._future = None
+            raise
+
+    @classmethod
+    async def _create(cls, *args, **kwargs):
+        obj = cls()
+        await obj.initialize(*args, **kwargs)
+        return obj
+
+
+class AsyncDatabase(AsyncSingleton):
+    connects = 0
+
+    async def initialize(self, host: str, port: int, password: str) -> None:
+        await asyncio.sleep(0.01)  # e.g. opening a connection
+        type(self).connects += 1
+        self.connection = Connection(host, port, password)
+
+    def __str__(self):
+        return "DB params: {}".format(self.connection)
+
+
+async def main():
+    databases = await asyncio.gather(*(
+        AsyncDatabase.instance(host='localhost', port=3306, password='123') for _ in range(100)))
+    print(databases[0])
+    print(len(set(map(id, databases))), AsyncDatabase.connects)
+    print(await AsyncDatabase.instance(host='localhost', port=22156, password='root') is databases[0])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+
+
+# ================ Output ================
+# DB params: Connection(host='localhost', port=3306, password='123')
+# 1 1
+# True
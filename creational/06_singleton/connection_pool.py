@@ -0,0 +1,241 @@
+"""
+Одинак, який володіє пулами з'єднань.
+Для кожного набору параметрів (host, port, password) створюється окремий
+обмежений пул, тож параметри наступних викликів більше не губляться,
+а одночасні запити йдуть через різні з'єднання.
+
+LocalServer — простий сервер у цьому ж процесі, на якому можна перевірити пул.
+"""
+import socket
+import socketserver
+import threading
+import time
+import typing as typ
+from collections import deque
+from contextlib import contextmanager
+
+from singleton import Connection, ThreadSafeDatabaseMeta
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+
+    def __init__(self, params: Connection, connect: typ.Callable[[Connection], typ.Any],
+                 max_size: int = 10, idle_timeout: float = 60.0,
+                 broken_errors: typ.Tuple[typ.Type[BaseException], ...] = (OSError, )):
+        self.params = params
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        # errors which mean the connection itself is unusable, others return it to the pool
+        self.broken_errors = broken_errors
+        self._connect = connect
+        self._idle = deque()  # type: typ.Deque[typ.Tuple[typ.Any, float]]
+        self._size = 0
+        self._condition = threading.Condition()
+        self.created = 0
+        self.closed_idle = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.waits = 0
+        self.wait_time = 0.0
+
+    def acquire(self, timeout: typ.Optional[float] = None):
+        with self._condition:
+            self._close_expired()
+            if not self._idle and self._size >= self.max_size:
+                self._wait(timeout)
+            if self._idle:
+                return self._idle.pop()[0]
+            self._size += 1
+        try:
+            connection = self._connect(self.params)
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self.created += 1
+        return connection
+
+    def release(self, connection, broken: bool = False) -> None:
+        with self._condition:
+            if broken:
+                self._size -= 1
+                self._close(connection)
+            else:
+                self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout: typ.Optional[float] = None):
+        connection = self.acquire(timeout)
+        broken = False
+        try:
+            yield connection
+        except self.broken_errors:
+            broken = True
+            raise
+        finally:
+            self.release(connection, broken)
+
+    def close(self) -> None:
+        with self._condition:
+            while self._idle:
+                self._size -= 1
+                self._close(self._idle.popleft()[0])
+
+    def stats(self) -> typ.Dict[str, typ.Union[int, float]]:
+        with self._condition:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "created": self.created,
+                "closed_idle": self.closed_idle,
+                "waiting": self.waiting,
+                "max_waiting": self.max_waiting,
+                "waits": self.waits,
+                "wait_time": self.wait_time,
+            }
+
+    def _wait(self, timeout: typ.Optional[float]) -> None:
+        self.waiting += 1
+        self.waits += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        start = time.monotonic()
+        try:
+            ready = self._condition.wait_for(
+                lambda: self._idle or self._size < self.max_size, timeout)
+        finally:
+            self.waiting -= 1
+            self.wait_time += time.monotonic() - start
+        if not ready:
+            raise PoolTimeout("No free connection to {}:{} after {}s".format(
+                self.params.host, self.params.port, timeout))
+
+    def _close_expired(self) -> None:
+        deadline = time.monotonic() - self.idle_timeout
+        # the oldest released connections are on the left
+        while self._idle and self._idle[0][1] < deadline:
+            self._size -= 1
+            self.closed_idle += 1
+            self._close(self._idle.popleft()[0])
+
+    @staticmethod
+    def _close(connection) -> None:
+        close = getattr(connection, "close", None)
+        if close is not None:
+            close()
+
+
+def socket_connect(params: Connection) -> socket.socket:
+    return socket.create_connection((params.host, params.port))
+
+
+class PooledDatabase(metaclass=ThreadSafeDatabaseMeta):
+
+    def __init__(self, connect: typ.Callable[[Connection], typ.Any] = socket_connect,
+                 max_size: int = 10, idle_timeout: float = 60.0,
+                 broken_errors: typ.Tuple[typ.Type[BaseException], ...] = (OSError, )):
+        self.connect = connect
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.broken_errors = broken_errors
+        self.pools = dict()  # type: typ.Dict[Connection, ConnectionPool]
+        self._lock = threading.Lock()
+
+    def pool(self, host: str, port: int, password: str) -> ConnectionPool:
+        params = Connection(host, port, password)
+        try:
+            return self.pools[params]
+        except KeyError:
+            with self._lock:
+                if params not in self.pools:
+                    self.pools[params] = ConnectionPool(
+                        params, self.connect, self.max_size, self.idle_timeout, self.broken_errors)
+                return self.pools[params]
+
+    def connection(self, host: str, port: int, password: str, timeout: typ.Optional[float] = None):
+        return self.pool(host, port, password).connection(timeout)
+
+    def close(self) -> None:
+        for pool in list(self.pools.values()):
+            pool.close()
+
+    def __str__(self):
+        return "DB pools: {}".format(", ".join(
+            "{}:{}".format(params.host, params.port) for params in self.pools))
+
+
+class QueryHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            self.wfile.write(b"OK " + line)
+
+
+class LocalServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), QueryHandler)
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+def query(connection: socket.socket, sql: str) -> str:
+    connection.sendall(sql.encode() + b"\n")
+    answer = b""
+    while not answer.endswith(b"\n"):
+        chunk = connection.recv(1024)
+        if not chunk:
+            # an OSError, so the pool discards the connection the server has dropped
+            raise ConnectionError("Connection closed by the server")
+        answer += chunk
+    return answer.decode().strip()
+
+
+if __name__ == "__main__":
+    with LocalServer() as server1, LocalServer() as server2:
+        host, port1 = server1.server_address
+        port2 = server2.server_address[1]
+        database = PooledDatabase(max_size=2)
+        print(database is PooledDatabase(max_size=100))
+
+        answers = []
+
+        def worker(number: int):
+            port = port1 if number % 2 else port2
+            with database.connection(host, port, "123") as connection:
+                answers.append(query(connection, "SELECT {}".format(number)))
+
+        threads = [threading.Thread(target=worker, args=(number, )) for number in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        print(len(answers), sorted(answers)[:2])
+        for pool in database.pools.values():
+            stats = pool.stats()
+            print("created <= max_size:", stats["created"] <= pool.max_size, "in use:", stats["in_use"])
+        database.close()
+
+
+# ================ Output ================
+# True
+# 20 ['OK SELECT 0', 'OK SELECT 1']
+# created <= max_size: True in use: 0
+# created <= max_size: True in use: 0
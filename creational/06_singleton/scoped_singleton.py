@@ -0,0 +1,143 @@
+"""
+Одинак з налаштовуваною областю дії:
+    global  — один екземпляр на процес, дочірні процеси після fork() успадковують його;
+    thread  — окремий екземпляр для кожного потоку, без блокувань;
+    process — один екземпляр на процес, після fork() дочірній процес створює свій;
+    key     — мультитон, окремий екземпляр для кожного набору аргументів.
+"""
+import inspect
+import os
+import threading
+import typing as typ
+
+from singleton import Connection
+
+GLOBAL = "global"
+THREAD = "thread"
+PROCESS = "process"
+KEY = "key"
+SCOPES = (GLOBAL, THREAD, PROCESS, KEY)
+
+
+class ScopedSingletonMeta(type):
+
+    def __new__(mcs, name, bases, namespace, scope: typ.Optional[str] = None, **kwargs):
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __init__(cls, name, bases, namespace, scope: typ.Optional[str] = None, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        cls._scope = scope or getattr(cls, "_scope", GLOBAL)
+        if cls._scope not in SCOPES:
+            raise ValueError("Unknown singleton scope: {}".format(cls._scope))
+        cls._signature = inspect.signature(cls.__init__)
+        cls.reset()
+        if cls._scope == PROCESS and hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=cls.reset)
+
+    def reset(cls) -> None:
+        cls._instances = dict()  # type: typ.Dict[typ.Hashable, typ.Any]
+        cls._local = threading.local()
+        cls._lock = threading.Lock()
+
+    def key(cls, *args, **kwargs) -> tuple:
+        """The same key for positional, keyword and default arguments of the same call"""
+        bound = cls._signature.bind(None, *args, **kwargs)
+        bound.apply_defaults()
+        key = []
+        for name, value in list(bound.arguments.items())[1:]:
+            if cls._signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD:
+                value = tuple(sorted(value.items()))
+            key.append((name, value))
+        return tuple(key)
+
+    def __call__(cls, *args, **kwargs):
+        if cls._scope == THREAD:
+            try:
+                return cls._local.instance
+            except AttributeError:
+                instance = cls._local.instance = super().__call__(*args, **kwargs)
+                return instance
+
+        key = cls.key(*args, **kwargs) if cls._scope == KEY else None
+        try:
+            return cls._instances[key]
+        except KeyError:
+            with cls._lock:
+                if key not in cls._instances:
+                    cls._instances[key] = super().__call__(*args, **kwargs)
+                return cls._instances[key]
+
+
+class Database:
+
+    def __init__(self, host: str, port: int, password: str):
+        self.connection = Connection(host, port, password)
+        self.pid = os.getpid()
+        self.thread = threading.current_thread().name
+
+    def __str__(self):
+        return "DB params: {}".format(self.connection)
+
+
+class GlobalDatabase(Database, metaclass=ScopedSingletonMeta, scope=GLOBAL):
+    pass
+
+
+class ThreadDatabase(Database, metaclass=ScopedSingletonMeta, scope=THREAD):
+    pass
+
+
+class ProcessDatabase(Database, metaclass=ScopedSingletonMeta, scope=PROCESS):
+    pass
+
+
+class KeyDatabase(Database, metaclass=ScopedSingletonMeta, scope=KEY):
+    pass
+
+
+def in_child(func: typ.Callable[[], str]) -> str:
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read)
+        os.write(write, func().encode())
+        os._exit(0)
+    os.close(write)
+    with os.fdopen(read) as pipe:
+        result = pipe.read()
+    os.waitpid(pid, 0)
+    return result
+
+
+if __name__ == "__main__":
+    params = dict(host='localhost', port=3306, password='123')
+
+    db1 = KeyDatabase(**params)
+    db2 = KeyDatabase(host='localhost', port=22156, password='root')
+    print(db1, db2, db1 is KeyDatabase('localhost', 3306, password='123'), sep='\n')
+
+    main_db = ThreadDatabase(**params)
+    thread_dbs = []
+    threads = [threading.Thread(target=lambda: thread_dbs.append(ThreadDatabase(**params)))
+               for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print("thread:", len({id(db) for db in thread_dbs + [main_db]}), "instances")
+
+    if hasattr(os, "fork"):
+        parent_global, parent_process = GlobalDatabase(**params), ProcessDatabase(**params)
+        print("global after fork, inherited:", in_child(
+            lambda: str(GlobalDatabase(**params).pid == parent_global.pid)))
+        print("process after fork, inherited:", in_child(
+            lambda: str(ProcessDatabase(**params).pid == parent_process.pid)))
+
+
+# ================ Output ================
+# DB params: Connection(host='localhost', port=3306, password='123')
+# DB params: Connection(host='localhost', port=22156, password='root')
+# True
+# thread: 4 instances
+# global after fork, inherited: True
+# process after fork, inherited: False
@@ -20,6 +20,7 @@
   Проблеми багатопоточності.
   Вимагає постійного створення Mock-об’єктів при юніт-тестуванні.
 """
+import threading
 from collections import namedtuple
 
 Connection = namedtuple("Connection", ('host', 'port', 'password'))
@@ -35,6 +36,22 @@ class DatabaseMeta(type):
         return cls._instance
 
 
+class ThreadSafeDatabaseMeta(DatabaseMeta):
+    """Double-checked locking: the lock is taken only while the instance is not created yet"""
+
+    def __init__(cls, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        cls._instance = None
+        cls._lock = threading.Lock()
+
+    def __call__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__call__(*args, **kwargs)
+        return cls._instance
+
+
 class Database(metaclass=DatabaseMeta):
 
     def __init__(self, host: str, port: int, password: str):
@@ -44,14 +61,23 @@ class Database(metaclass=DatabaseMeta):
         return "DB params: {}".format(self.connection)
 
 
+class ThreadSafeDatabase(Database, metaclass=ThreadSafeDatabaseMeta):
+    pass
+
+
 if __name__ == "__main__":
     db1 = Database(host='localhost', port=3306, password='123')
     db2 = Database(host='localhost', port=22156, password='root')
 
     print(db1, db2, id(db1) == id(db2), sep='\n')
 
+    db3 = ThreadSafeDatabase(host='localhost', port=5432, password='pass')
+    print(db3, db3 is ThreadSafeDatabase(host='localhost', port=5433, password='root'), sep='\n')
+
 
 # ================ Output ================
 # DB params: Connection(host='localhost', port=3306, password='123')
 # DB params: Connection(host='localhost', port=3306, password='123')
 # True
+# DB params: Connection(host='localhost', port=5432, password='pass')
+# True
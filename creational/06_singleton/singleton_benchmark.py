@@ -0,0 +1,55 @@
+"""
+Гонка потоків за створення одинака та ціна виклику вже створеного одинака
+для DatabaseMeta і ThreadSafeDatabaseMeta.
+"""
+import threading
+import time
+import timeit
+
+from singleton import Database, DatabaseMeta, ThreadSafeDatabaseMeta
+
+THREADS = 64
+
+
+def make_slow_database(metaclass: type) -> type:
+    class SlowDatabase(Database, metaclass=metaclass):
+        created = 0
+
+        def __init__(self, *args, **kwargs):
+            time.sleep(0.01)  # e.g. opening a connection
+            type(self).created += 1
+            super().__init__(*args, **kwargs)
+
+    SlowDatabase._instance = None
+    return SlowDatabase
+
+
+def race(metaclass: type) -> None:
+    database = make_slow_database(metaclass)
+    barrier = threading.Barrier(THREADS)
+    instances = set()
+
+    def connect():
+        barrier.wait()
+        instances.add(id(database(host='localhost', port=3306, password='123')))
+
+    threads = [threading.Thread(target=connect) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    elapsed = min(timeit.repeat(
+        lambda: database(host='localhost', port=3306, password='123'), number=1000000, repeat=5))
+    print("{:<22} {} threads: {:>2} created, {:>2} distinct, {:.0f} ns per call".format(
+        metaclass.__name__, THREADS, database.created, len(instances), elapsed * 1000))
+
+
+if __name__ == "__main__":
+    race(DatabaseMeta)
+    race(ThreadSafeDatabaseMeta)
+
+
+# ================ Output ================
+# DatabaseMeta           64 threads: 64 created, 64 distinct, 922 ns per call
+# ThreadSafeDatabaseMeta 64 threads:  1 created,  1 distinct, 810 ns per call
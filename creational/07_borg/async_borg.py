@@ -0,0 +1,52 @@
+"""
+Borg для asyncio-сервісів: усі екземпляри мають спільний стан,
+разом з future асинхронного підключення.
+Перший `await db.connect()` підключається, інші екземпляри,
+які викликали connect() одночасно, чекають на те саме підключення.
+"""
+import asyncio
+
+
+class AsyncSQLDatabase:
+    __shared_status = {"status": "not connected", "connects": 0, "_connecting": None}
+
+    def __init__(self):
+        self.__dict__ = self.__shared_status
+
+    async def connect(self) -> None:
+        connecting = self._connecting
+        if connecting is None:
+            connecting = self._connecting = asyncio.ensure_future(self._connect())
+        try:
+            await asyncio.shield(connecting)
+        except BaseException:
+            if connecting.done() and self._connecting is connecting and (
+                    connecting.cancelled() or connecting.exception()):
+                self._connecting = None
+            raise
+
+    async def _connect(self) -> None:
+        self.status = 'connecting'
+        await asyncio.sleep(0.01)  # e.g. opening a connection
+        self.connects += 1
+        self.status = 'connected'
+
+    def __str__(self):
+        return self.status
+
+
+async def main():
+    databases = [AsyncSQLDatabase() for _ in range(100)]
+    print(databases[0])
+    await asyncio.gather(*(db.connect() for db in databases))
+    await AsyncSQLDatabase().connect()
+    print('db1: {}, db2: {}, connects: {}'.format(databases[0], databases[1], databases[0].connects))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
+
+
+# ================ Output ================
+# not connected
+# db1: connected, db2: connected, connects: 1
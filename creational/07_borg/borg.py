@@ -3,14 +3,99 @@ Borg - is a way to implement singleton behavior,
 but instead of having only one instance of a class,
 there are multiple instances that share the same state.
 """
+import threading
+import typing as typ
 
 
-class SQLDatabase:
-    __shared_status = {}
+class SharedState:
 
     def __init__(self):
-        self.__dict__ = self.__shared_status
-        self.status = 'not connected'
+        self.values = dict()  # type: typ.Dict[str, typ.Any]
+        self.version = 0
+        self.lock = threading.RLock()
+
+
+class Borg:
+    """Instances of a Borg class share their attributes.
+    Writes are made under a lock and bump the state version, reads are lock-free.
+    Subclasses share the state of their parent unless created with isolated=True,
+    names of the class attributes (version, update, ...) can not be used for the state"""
+
+    _state = SharedState()
+
+    def __init_subclass__(cls, isolated: bool = False, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # the keyword is not stored, so subclasses of an isolated class share its state
+        if isolated or Borg in cls.__bases__:
+            cls._state = SharedState()
+
+    @classmethod
+    def _check_name(cls, name: str) -> None:
+        if hasattr(cls, name):
+            raise AttributeError("'{}' is reserved by {}".format(name, cls.__name__))
+
+    def __init__(self, **defaults):
+        state = self._state
+        object.__setattr__(self, "__dict__", state.values)
+        with state.lock:
+            for name, value in defaults.items():
+                self._check_name(name)
+                if name not in state.values:
+                    state.values[name] = value
+                    state.version += 1
+
+    def __setattr__(self, name: str, value: typ.Any) -> None:
+        self._check_name(name)
+        state = self._state
+        with state.lock:
+            state.values[name] = value
+            state.version += 1
+
+    def __delattr__(self, name: str) -> None:
+        self._check_name(name)
+        state = self._state
+        with state.lock:
+            try:
+                del state.values[name]
+            except KeyError:
+                raise AttributeError(name) from None
+            state.version += 1
+
+    @property
+    def version(self) -> int:
+        return self._state.version
+
+    def update(self, name: str, func: typ.Callable[[typ.Any], typ.Any], default: typ.Any = None) -> typ.Any:
+        self._check_name(name)
+        state = self._state
+        with state.lock:
+            value = state.values[name] = func(state.values.get(name, default))
+            state.version += 1
+            return value
+
+    def increment(self, name: str, delta: typ.Union[int, float] = 1) -> typ.Union[int, float]:
+        return self.update(name, lambda value: value + delta, 0)
+
+    def compare_and_set(self, name: str, expected: typ.Any, value: typ.Any) -> bool:
+        self._check_name(name)
+        state = self._state
+        with state.lock:
+            if state.values.get(name) != expected:
+                return False
+            state.values[name] = value
+            state.version += 1
+            return True
+
+    def snapshot(self) -> typ.Tuple[int, typ.Dict[str, typ.Any]]:
+        state = self._state
+        with state.lock:
+            return state.version, dict(state.values)
+
+
+class SQLDatabase(Borg):
+
+    def __init__(self):
+        super().__init__(status='not connected')
 
     def __str__(self):
         return self.status
@@ -20,6 +105,10 @@ class PostreSQL(SQLDatabase):
     pass
 
 
+class MySQL(SQLDatabase, isolated=True):
+    pass
+
+
 if __name__ == '__main__':
     db1 = SQLDatabase()
     db2 = SQLDatabase()
@@ -34,8 +123,17 @@ if __name__ == '__main__':
 
     print('db1: {}, db2: {}, db3: {}'.format(db1, db2, db3))
 
+    db4 = MySQL()
+    print(db4.compare_and_set('status', 'not connected', 'connecting'), db4, db1)
+    version = db1.version
+    db2.increment('queries')
+    db3.increment('queries')
+    print(db1.queries, db1.version - version)
+
 
 # ================ Output ================
 # db1: connected, db2: connected
 # False
-# db1: not connected, db2: not connected, db3: not connected
+# db1: connected, db2: connected, db3: connected
+# True connecting connected
+# 2 2
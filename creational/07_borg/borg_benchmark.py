@@ -0,0 +1,66 @@
+"""
+Multithreaded updates of Borg shared state: plain read-then-write
+versus atomic increment(), and the cost of detecting changes by version
+versus re-reading a snapshot.
+"""
+import sys
+import threading
+import time
+import timeit
+
+from borg import Borg
+
+THREADS = 8
+UPDATES = 50000
+
+
+class Counter(Borg):
+
+    def __init__(self):
+        super().__init__(value=0)
+
+
+def plain():
+    counter = Counter()
+    for _ in range(UPDATES):
+        counter.value = counter.value + 1
+
+
+def atomic():
+    counter = Counter()
+    for _ in range(UPDATES):
+        counter.increment('value')
+
+
+def race(worker) -> None:
+    Counter().value = 0
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    print("{:<7} {} threads: {:>7} of {} updates kept, {:.3f}s".format(
+        worker.__name__, THREADS, Counter().value, THREADS * UPDATES, elapsed))
+
+
+if __name__ == "__main__":
+    sys.setswitchinterval(1e-6)  # switch threads often to expose lost updates
+    race(plain)
+    race(atomic)
+    sys.setswitchinterval(0.005)
+
+    counter = Counter()
+    for name in range(50):
+        setattr(counter, "field_{}".format(name), name)
+    seen = counter.version
+    print("version check: {:.0f} ns, snapshot: {:.0f} ns".format(
+        min(timeit.repeat(lambda: counter.version != seen, number=100000, repeat=5)) * 1e4,
+        min(timeit.repeat(counter.snapshot, number=100000, repeat=5)) * 1e4))
+
+
+# ================ Output ================
+# plain   8 threads:  260950 of 400000 updates kept, 0.349s
+# atomic  8 threads:  400000 of 400000 updates kept, 0.674s
+# version check: 185 ns, snapshot: 1197 ns
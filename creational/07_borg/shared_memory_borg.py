@@ -0,0 +1,239 @@
+"""
+Borg, спільний стан якого лежить у multiprocessing.shared_memory,
+тому його бачать усі робочі процеси, а не лише один інтерпретатор.
+Стан має фіксовану компактну схему: кожне поле — це struct-формат
+за своїм зміщенням у сегменті.
+
+Читання не блокуються (seqlock: лічильник версії непарний, поки йде запис),
+записи серіалізуються блокуванням файлу з назвою сегмента,
+тож працюють для процесів, запущених і через fork, і через spawn чи forkserver.
+"""
+import multiprocessing
+import os
+import struct
+import tempfile
+import threading
+import typing as typ
+from multiprocessing import shared_memory
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+HEADER = struct.Struct("Q")
+SPINS = 10000
+
+
+class SegmentLock:
+    """Write lock of a segment for any processes, however they were started:
+    a lock of the file named after the segment plus a thread lock inside the process"""
+
+    def __init__(self, segment_name: str):
+        self.path = os.path.join(tempfile.gettempdir(), "{}.lock".format(segment_name))
+        self.reset()
+
+    def reset(self) -> None:
+        # a descriptor inherited over fork would share the file lock with the parent
+        self._thread_lock = threading.Lock()
+        self._file = None  # type: typ.Optional[typ.BinaryIO]
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        try:
+            if self._file is None:
+                self._file = open(self.path, "a+b")
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._thread_lock.release()
+
+
+locks = dict()  # type: typ.Dict[str, SegmentLock]
+
+
+def reset_locks() -> None:
+    for lock in locks.values():
+        lock.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_locks)
+
+
+class Field:
+
+    def __init__(self, fmt: str):
+        self.struct = struct.Struct(fmt)
+        self.is_text = fmt.endswith("s")
+        self.offset = None  # type: int
+        self.name = None  # type: str
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = obj.read(self)
+        return value.rstrip(b"\0").decode() if self.is_text else value
+
+    def __set__(self, obj, value):
+        if self.is_text:
+            value = value.encode()
+            if len(value) > self.struct.size:
+                raise ValueError("{} takes at most {} bytes, got {}".format(
+                    self.name, self.struct.size, len(value)))
+        obj.write(self, value)
+
+
+class SharedMemoryBorg:
+    segment_name = None  # type: str
+    fields = ()  # type: typ.Tuple[Field, ...]
+    size = HEADER.size
+    lock = None
+    _memory = None  # type: shared_memory.SharedMemory
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # parent fields keep their offsets, a subclass only appends its own fields
+        fields = dict()  # type: typ.Dict[str, Field]
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, Field):
+                    fields[name] = value
+        offset = HEADER.size
+        for field in fields.values():
+            field.offset = offset
+            offset += field.struct.size
+        cls.fields = tuple(fields.values())
+        cls.size = offset
+        # classes attached to the same segment must serialise their writes with one lock
+        if cls.segment_name not in locks:
+            locks[cls.segment_name] = SegmentLock(cls.segment_name)
+        cls.lock = locks[cls.segment_name]
+        cls._memory = None
+
+    def __init__(self):
+        cls = type(self)
+        if cls._memory is None:
+            try:
+                cls._memory = shared_memory.SharedMemory(cls.segment_name, create=True, size=cls.size)
+            except FileExistsError:
+                memory = shared_memory.SharedMemory(cls.segment_name)
+                if memory.size < cls.size:
+                    memory.close()
+                    raise ValueError("Segment {} has {} bytes, {} needs {}".format(
+                        cls.segment_name, memory.size, cls.__name__, cls.size))
+                cls._memory = memory
+
+    @property
+    def version(self) -> int:
+        return HEADER.unpack_from(self._memory.buf, 0)[0] // 2
+
+    def read(self, field: Field):
+        buf = self._memory.buf
+        for _ in range(SPINS):
+            sequence = HEADER.unpack_from(buf, 0)[0]
+            if sequence & 1:
+                continue  # a writer is in the middle of an update
+            value = field.struct.unpack_from(buf, field.offset)[0]
+            if HEADER.unpack_from(buf, 0)[0] == sequence:
+                return value
+        # the writer is slow or died in the middle of an update, wait for the lock instead
+        with self.lock:
+            self._repair(buf)
+            return field.struct.unpack_from(buf, field.offset)[0]
+
+    def write(self, field: Field, value) -> None:
+        with self.lock:
+            self._write(field, value)
+
+    def increment(self, name: str, delta: int = 1) -> int:
+        field = getattr(type(self), name)
+        with self.lock:
+            value = field.struct.unpack_from(self._memory.buf, field.offset)[0] + delta
+            self._write(field, value)
+            return value
+
+    def _write(self, field: Field, value) -> None:
+        buf = self._memory.buf
+        sequence = self._repair(buf)
+        HEADER.pack_into(buf, 0, sequence + 1)
+        field.struct.pack_into(buf, field.offset, value)
+        HEADER.pack_into(buf, 0, sequence + 2)
+
+    @staticmethod
+    def _repair(buf) -> int:
+        """Called under the lock, an odd sequence is left by a writer that died mid-update"""
+        sequence = HEADER.unpack_from(buf, 0)[0]
+        if sequence & 1:
+            sequence += 1
+            HEADER.pack_into(buf, 0, sequence)
+        return sequence
+
+    @classmethod
+    def close(cls) -> None:
+        if cls._memory is not None:
+            cls._memory.close()
+            cls._memory = None
+
+    @classmethod
+    def unlink(cls) -> None:
+        memory = cls._memory or shared_memory.SharedMemory(cls.segment_name)
+        memory.unlink()
+        cls._memory = memory
+        cls.close()
+
+
+class SQLDatabase(SharedMemoryBorg):
+    segment_name = "borg_sql_database"
+    status = Field("16s")
+    connections = Field("q")
+    queries = Field("q")
+
+    def __str__(self):
+        return self.status
+
+
+def worker(queries: int) -> None:
+    db = SQLDatabase()
+    db.increment("connections")
+    for _ in range(queries):
+        db.increment("queries")
+    db.status = "connected"
+
+
+if __name__ == '__main__':
+    db = SQLDatabase()
+    db.status = "not connected"
+    try:
+        # spawned workers do not inherit anything from this process, the lock works for them too
+        context = multiprocessing.get_context("spawn")
+        processes = [context.Process(target=worker, args=(1000, )) for _ in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        print("db: {}, connections: {}, queries: {}, size: {} bytes".format(
+            db, db.connections, db.queries, SQLDatabase.size))
+    finally:
+        SQLDatabase.unlink()
+
+
+# ================ Output ================
+# db: connected, connections: 4, queries: 4000, size: 40 bytes
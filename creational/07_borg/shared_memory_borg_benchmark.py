@@ -0,0 +1,41 @@
+"""
+Read/write latency of the shared memory Borg state
+versus a multiprocessing.Manager dict.
+"""
+import multiprocessing
+import timeit
+
+from shared_memory_borg import SQLDatabase
+
+N = 20000
+
+
+def latency(func) -> float:
+    return min(timeit.repeat(func, number=N, repeat=3)) / N * 1e9
+
+
+if __name__ == "__main__":
+    db = SQLDatabase()
+    try:
+        with multiprocessing.Manager() as manager:
+            status = manager.dict(status="not connected", queries=0)
+
+            def manager_write():
+                status["queries"] = 1
+
+            def shared_write():
+                db.queries = 1
+
+            results = (
+                ("Manager dict", latency(lambda: status["queries"]), latency(manager_write)),
+                ("shared memory", latency(lambda: db.queries), latency(shared_write)),
+            )
+        for name, read, write in results:
+            print("{:<14} read: {:>8.0f} ns, write: {:>8.0f} ns".format(name, read, write))
+    finally:
+        SQLDatabase.unlink()
+
+
+# ================ Output ================
+# Manager dict   read:    29269 ns, write:    28965 ns
+# shared memory  read:      944 ns, write:     3646 ns
@@ -0,0 +1,156 @@
+"""
+Sinks for the output of the pattern examples.
+
+Every example module writes through a module level ``output`` callable,
+which is ``print`` by default. Install a sink to redirect, buffer or drop
+that output without touching the products themselves:
+
+    install(BatchedSink(every=1000), composite)
+"""
+import sys
+import typing as typ
+from abc import ABC, abstractmethod
+from types import ModuleType
+
+
+class Sink(ABC):
+
+    @abstractmethod
+    def write(self, text: str) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class NullSink(Sink):
+
+    def write(self, text: str) -> None:
+        pass
+
+
+class BufferedSink(Sink):
+
+    def __init__(self):
+        self.records = list()  # type: typ.List[str]
+
+    def write(self, text: str) -> None:
+        self.records.append(text)
+
+    def getvalue(self) -> str:
+        return "".join(record + "\n" for record in self.records)
+
+    def clear(self) -> None:
+        self.records.clear()
+
+
+class FileSink(Sink):
+
+    def __init__(self, file: typ.Union[str, typ.TextIO]):
+        self._owns_file = isinstance(file, str)
+        self.file = open(file, "w") if self._owns_file else file
+
+    def write(self, text: str) -> None:
+        self.file.write(text + "\n")
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._owns_file:
+            self.file.close()
+
+
+class BatchedSink(Sink):
+    """Collects records and writes them to the stream with one call per every records"""
+
+    def __init__(self, stream: typ.Optional[typ.TextIO] = None, every: int = 1000):
+        self.stream = stream
+        self.every = every
+        self._records = list()  # type: typ.List[str]
+
+    def write(self, text: str) -> None:
+        self._records.append(text)
+        if len(self._records) >= self.every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._records:
+            stream = self.stream or sys.stdout
+            stream.write("\n".join(self._records) + "\n")
+            self._records.clear()
+        if self.stream is not None:
+            self.stream.flush()
+
+
+def install(sink: typ.Union[Sink, typ.Callable[[str], None]], *modules: ModuleType) -> None:
+    write = sink.write if isinstance(sink, Sink) else sink
+    for module in modules:
+        module.output = write
+
+
+def uninstall(*modules: ModuleType) -> None:
+    install(print, *modules)
+
+
+if __name__ == "__main__":
+    import importlib.util
+    import os
+    import time
+    from contextlib import redirect_stdout
+
+    N = 200000
+
+    def load(path: str) -> ModuleType:
+        spec = importlib.util.spec_from_file_location("composite", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    composite = load(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  "structural", "03_composite", "composite.py"))
+    graphic = composite.CompositeGraphic()
+    for _ in range(N):
+        graphic.add(composite.Dot())
+
+    def bench(name: str, sink) -> None:
+        install(sink, composite)
+        start = time.perf_counter()
+        graphic.draw()
+        if isinstance(sink, Sink):
+            sink.close()
+        print("{:<28} {:.3f}s".format(name, time.perf_counter() - start))
+
+    # like a terminal, stdout is line buffered
+    with open(os.devnull, "w", buffering=1) as devnull:
+        with redirect_stdout(devnull):
+            start = time.perf_counter()
+            graphic.draw()
+            elapsed = time.perf_counter() - start
+    print("{:<28} {:.3f}s".format("print (line buffered)", elapsed))
+
+    with open(os.devnull, "w", buffering=1) as devnull:
+        bench("FileSink", FileSink(devnull))
+    with open(os.devnull, "w", buffering=1) as devnull:
+        bench("BatchedSink(every=1000)", BatchedSink(devnull, every=1000))
+    bench("BufferedSink", BufferedSink())
+    bench("NullSink", NullSink())
+    uninstall(composite)
+
+
+# ================ Output ================
+# print (line buffered)        0.610s
+# FileSink                     0.498s
+# BatchedSink(every=1000)      0.215s
+# BufferedSink                 0.193s
+# NullSink                     0.147s
@@ -8,6 +8,9 @@
 Недоліки:
   Ускладнює код програми внаслідок введення додаткових класів.
 """
+import inspect
+import typing as typ
+from operator import attrgetter
 from typing import Any
 
 
@@ -50,6 +53,56 @@ class Adapter:
         return str(self.obj)
 
 
+class CachingAdapter(Adapter):
+    """Binds delegated methods onto the adapter on first lookup, so next lookups
+    are plain instance attribute hits. Data attributes are always read from the
+    adapted object, call invalidate() after replacing a method on it"""
+
+    def __init__(self, obj: Any, **adapted_methods):
+        super().__init__(obj, **adapted_methods)
+        self._cached = set()  # type: typ.Set[str]
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self.obj, attr)
+        if inspect.ismethod(value) or inspect.isfunction(value) or inspect.isbuiltin(value):
+            self.__dict__[attr] = value
+            self._cached.add(attr)
+        return value
+
+    def invalidate(self, *attrs: str) -> None:
+        """Drops the given cached methods, or all of them, adapted methods are kept"""
+        for attr in attrs or tuple(self._cached):
+            if attr in self._cached:
+                self._cached.discard(attr)
+                del self.__dict__[attr]
+
+
+class SlotsAdapter:
+    """Base for adapter classes made by adapter_class(), instances hold only the adapted object"""
+    __slots__ = ("obj", )
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.obj, attr)
+
+    def __str__(self) -> str:
+        return str(self.obj)
+
+    @classmethod
+    def wrap(cls, objects: typ.Iterable[Any]) -> typ.Iterator["SlotsAdapter"]:
+        return map(cls, objects)
+
+
+def adapter_class(name: str, **adapted_methods: str) -> typ.Type[SlotsAdapter]:
+    """Builds the adapter class once from a spec of new names to adapted methods, e.g. do_it="play" """
+    namespace = {"__slots__": ()}  # type: typ.Dict[str, Any]
+    for method, target in adapted_methods.items():
+        namespace[method] = property(attrgetter("obj." + target))
+    return type(name, (SlotsAdapter, ), namespace)
+
+
 if __name__ == "__main__":
     guitar = Guitar('Fender')
     guitar_adapted = Adapter(guitar, do_it=guitar.play)
@@ -61,7 +114,21 @@ if __name__ == "__main__":
         str(guitar_adapted), guitar_adapted.do_it(),
         str(ear_adapted), ear_adapted.do_it()))
 
+    guitar_cached = CachingAdapter(guitar, do_it=guitar.play)
+    print(guitar_cached.play(), guitar_cached.name, sorted(guitar_cached._cached))
+    guitar_cached.invalidate("play", "do_it", "obj")
+    print(guitar_cached.do_it(), sorted(vars(guitar_cached)))
+
+    GuitarAdapter = adapter_class("GuitarAdapter", do_it="play")
+    guitars = GuitarAdapter.wrap(Guitar(name) for name in ("Gibson", "Ibanez"))
+    for guitar_adapted in guitars:
+        print(guitar_adapted, guitar_adapted.do_it())
+
 
 # ================ Output ================
 # the Fender guitar is playing a Jazz song
 # the left ear is listening
+# is playing a Jazz song Fender ['play']
+# is playing a Jazz song ['_cached', 'do_it', 'obj']
+# the Gibson guitar is playing a Jazz song
+# the Ibanez guitar is playing a Jazz song
@@ -0,0 +1,26 @@
+"""
+Пропускна здатність делегованих викликів через Adapter та CachingAdapter.
+"""
+import timeit
+
+from adapter import Adapter, CachingAdapter, Guitar
+
+N = 1000000
+
+
+if __name__ == "__main__":
+    guitar = Guitar('Fender')
+    cases = (
+        ("direct", guitar),
+        ("Adapter", Adapter(guitar, do_it=guitar.play)),
+        ("CachingAdapter", CachingAdapter(guitar, do_it=guitar.play)),
+    )
+    for name, obj in cases:
+        elapsed = min(timeit.repeat(lambda: obj.play(), number=N, repeat=5))
+        print("{:<15} {:>6.1f} M calls/s".format(name, N / elapsed / 1e6))
+
+
+# ================ Output ================
+# direct            11.5 M calls/s
+# Adapter            0.8 M calls/s
+# CachingAdapter     7.0 M calls/s
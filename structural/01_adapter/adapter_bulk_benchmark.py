@@ -0,0 +1,43 @@
+"""
+Пам'ять і швидкість адаптації великої колекції об'єктів:
+Adapter для кожного об'єкта проти класу адаптера з adapter_class().
+"""
+import gc
+import time
+import tracemalloc
+
+from adapter import Adapter, Guitar, adapter_class
+
+N = 300000
+
+GuitarAdapter = adapter_class("GuitarAdapter", do_it="play")
+
+
+def per_object(guitars):
+    return [Adapter(guitar, do_it=guitar.play) for guitar in guitars]
+
+
+def bulk(guitars):
+    return list(GuitarAdapter.wrap(guitars))
+
+
+if __name__ == "__main__":
+    guitars = [Guitar("Fender") for _ in range(N)]
+    for func in (per_object, bulk):
+        start = time.perf_counter()
+        played = sum(1 for adapted in func(guitars) if adapted.do_it())
+        elapsed = time.perf_counter() - start
+
+        gc.collect()
+        tracemalloc.start()
+        adapters = func(guitars)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del adapters
+        print("{:<11} adapt + call: {:.3f}s for {}, {:5.1f} MiB".format(
+            func.__name__, elapsed, played, size / 2 ** 20))
+
+
+# ================ Output ================
+# per_object  adapt + call: 0.713s for 300000,  46.0 MiB
+# bulk        adapt + call: 0.308s for 300000,  13.9 MiB
@@ -0,0 +1,160 @@
+"""
+Асинхронний Міст: пристрої, які виконують введення/виведення, і пульти до них.
+FleetRemote розсилає команду тисячам пристроїв одночасно,
+обмежує кількість одночасних викликів, має тайм-аут на кожен пристрій
+і повертає результат окремо для кожного пристрою.
+
+AsyncTV та AsyncRadio імітують справжні пристрої із заданою затримкою.
+"""
+import asyncio
+import typing as typ
+from collections import namedtuple
+from functools import wraps
+
+output = print
+
+Result = namedtuple("Result", ("device", "ok", "error"))
+
+
+class DeviceOffError(Exception):
+    pass
+
+
+def when_turned_on(method):
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if not self.is_enabled:
+            raise DeviceOffError("Please turn on the {} first".format(self.name))
+        await method(self, *args, **kwargs)
+    return wrapper
+
+
+class AsyncDevice:
+
+    def __init__(self, name: typ.Optional[str] = None, latency: float = 0.0):
+        self.name = name or type(self).__name__
+        self.latency = latency
+        self.is_enabled = False
+        self.channel = 1
+        self.volume = 10
+        self.channel_step = 1
+
+    async def send(self, command: str) -> None:
+        """Here a real device does its I/O"""
+        await asyncio.sleep(self.latency)
+
+    async def enable(self):
+        await self.send("on")
+        self.is_enabled = True
+
+    async def disable(self):
+        await self.send("off")
+        self.is_enabled = False
+
+    @when_turned_on
+    async def set_volume(self, value: typ.Union[int, float]):
+        value = value if value > 0 else 0
+        await self.send("volume {}".format(value))
+        self.volume = value
+
+    @when_turned_on
+    async def set_channel(self, value: typ.Union[int, float]):
+        value = value if value >= 0 else 0
+        await self.send("channel {}".format(value))
+        self.channel = value
+
+
+class AsyncRemote:
+
+    def __init__(self, device: AsyncDevice):
+        self.device = device
+
+    async def toggle_power(self):
+        await (self.device.disable() if self.device.is_enabled else self.device.enable())
+
+    async def volume_up(self):
+        await self.device.set_volume(self.device.volume + 10)
+
+    async def volume_down(self):
+        await self.device.set_volume(self.device.volume - 10)
+
+    async def next_channel(self):
+        await self.device.set_channel(self.device.channel + self.device.channel_step)
+
+    async def previous_channel(self):
+        await self.device.set_channel(self.device.channel - self.device.channel_step)
+
+    async def mute(self):
+        await self.device.set_volume(0)
+
+
+class FleetRemote:
+
+    def __init__(self, devices: typ.Iterable[AsyncDevice], concurrency: int = 100,
+                 timeout: typ.Optional[float] = 1.0, remote_class: type = AsyncRemote):
+        self.remotes = [remote_class(device) for device in devices]
+        self.concurrency = concurrency
+        self.timeout = timeout
+
+    async def broadcast(self, command: str) -> typ.List[Result]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(remote: AsyncRemote) -> Result:
+            async with semaphore:
+                try:
+                    await asyncio.wait_for(getattr(remote, command)(), self.timeout)
+                except Exception as error:
+                    return Result(remote.device, False, error)
+                return Result(remote.device, True, None)
+
+        return await asyncio.gather(*(run(remote) for remote in self.remotes))
+
+
+class AsyncTV(AsyncDevice):
+    pass
+
+
+class AsyncRadio(AsyncDevice):
+
+    def __init__(self, name: typ.Optional[str] = None, latency: float = 0.0):
+        super().__init__(name, latency)
+        self.channel = 99.0
+        self.channel_step = 0.2
+
+
+def report(command: str, results: typ.List[Result]) -> None:
+    errors = dict()  # type: typ.Dict[str, int]
+    for result in results:
+        if not result.ok:
+            name = type(result.error).__name__
+            errors[name] = errors.get(name, 0) + 1
+    output("{}: {} ok, errors: {}".format(
+        command, sum(result.ok for result in results), errors))
+
+
+async def main():
+    devices = [
+        # every 100th device hangs longer than the timeout
+        (AsyncTV if number % 2 else AsyncRadio)("device {}".format(number),
+                                                latency=0.5 if number % 100 == 0 else 0.01)
+        for number in range(2000)
+    ]
+    fleet = FleetRemote(devices, concurrency=500, timeout=0.1)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    report("next_channel", await fleet.broadcast("next_channel"))
+    report("toggle_power", await fleet.broadcast("toggle_power"))
+    report("volume_up", await fleet.broadcast("volume_up"))
+    output("took less than a second: {}".format(loop.time() - start < 1))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+
+
+# ================ Output ================
+# next_channel: 0 ok, errors: {'DeviceOffError': 2000}
+# toggle_power: 1980 ok, errors: {'TimeoutError': 20}
+# volume_up: 1980 ok, errors: {'DeviceOffError': 20}
+# took less than a second: True
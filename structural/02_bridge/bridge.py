@@ -18,14 +18,17 @@
 import typing as typ
 from functools import wraps
 
+output = print
+
 
 def when_turned_on(method):
     @wraps(method)
     def wrapper(self, *args, **kwargs):
         if not self.is_enabled:
-            print("Please turn on the {} first".format(type(self).__name__))
+            output("Please turn on the {} first".format(type(self).__name__))
             return
         method(self, *args, **kwargs)
+    wrapper.requires_enabled = True
     return wrapper
 
 
@@ -39,26 +42,79 @@ class Device:
 
     def enable(self):
         self.is_enabled = True
-        print("Turning on {}".format(
+        output("Turning on {}".format(
             type(self).__name__))
 
     def disable(self):
         self.is_enabled = False
-        print("Turning off {}".format(
+        output("Turning off {}".format(
             type(self).__name__))
 
     @when_turned_on
     def set_volume(self, value: typ.Union[int, float]):
         self.volume = value if value > 0 else 0
-        print("Set {} volume: {}".format(
+        output("Set {} volume: {}".format(
             type(self).__name__, self.volume))
 
     @when_turned_on
     def set_channel(self, value: typ.Union[int, float]):
         self.channel = value if value >= 0 else 0
-        print("Set {} channel: {}".format(
+        output("Set {} channel: {}".format(
             type(self).__name__, self.channel))
 
+    @when_turned_on
+    def set_state(self, volume: typ.Union[int, float], channel: typ.Union[int, float]):
+        self.volume = volume if volume > 0 else 0
+        self.channel = channel if channel >= 0 else 0
+        output("Set {} volume: {}, channel: {}".format(
+            type(self).__name__, self.volume, self.channel))
+
+
+def refused(self, *args, **kwargs):
+    output("Please turn on the {} first".format(type(self).__name__))
+
+
+class StatefulDevice(Device):
+    """Behaves like Device, but instead of checking is_enabled on every call,
+    switching the power switches the class of the device:
+    a turned on device is an instance of the class with the unguarded methods,
+    a turned off one of its generated "off" subclass with refusing stubs.
+    Overrides of guarded methods still run while off, their super() calls are refused"""
+
+    _on_class = None  # type: typ.Optional[type]
+    _off_class = None  # type: typ.Optional[type]
+
+    def __init_subclass__(cls, refusing: bool = False, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if refusing:
+            return
+        guarded = {name for klass in cls.__mro__ for name, value in vars(klass).items()
+                   if getattr(value, "requires_enabled", False)}
+        unwrapped = []
+        for name in guarded:
+            method = getattr(cls, name)
+            if getattr(method, "requires_enabled", False):
+                setattr(cls, name, method.__wrapped__)
+                unwrapped.append(name)
+        namespace = {name: refused for name in unwrapped}
+        # same name for the messages, a qualname reachable from the module for pickle
+        namespace.update(__module__=cls.__module__, __qualname__=cls.__qualname__ + ".off")
+        # the "off" classes of the parents go right after cls, so super() calls of overrides reach their stubs
+        parents_off = tuple(vars(base)["off"] for base in cls.__bases__ if "off" in vars(base))
+        cls.off = type(cls.__name__, (cls, ) + parents_off, namespace, refusing=True)
+        cls._on_class, cls._off_class = cls, cls.off
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.__dict__["is_enabled"]
+
+    @is_enabled.setter
+    def is_enabled(self, value: bool):
+        self.__dict__["is_enabled"] = value
+        # StatefulDevice itself has no variants and keeps the guarded methods of Device
+        if self._on_class is not None:
+            self.__class__ = self._on_class if value else self._off_class
+
 
 class Remote:
 
@@ -88,6 +144,66 @@ class AdvancedRemote(Remote):
         self.device.set_volume(0)
 
 
+class BatchingRemote(AdvancedRemote):
+    """Queues commands and applies only their net result to the device on flush().
+    The device should not be changed by anything else while commands are queued"""
+
+    def __init__(self, device: Device):
+        super().__init__(device)
+        self.pending = 0
+        self._load()
+
+    def _load(self):
+        self._enabled = self.device.is_enabled
+        self._volume = self.device.volume
+        self._channel = self.device.channel
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+    def toggle_power(self):
+        self.pending += 1
+        self._enabled = not self._enabled
+
+    def volume_up(self):
+        self._set_volume(self._volume + 10)
+
+    def volume_down(self):
+        self._set_volume(self._volume - 10)
+
+    def mute(self):
+        self._set_volume(0)
+
+    def next_channel(self):
+        self._set_channel(self._channel + self.device.channel_step)
+
+    def previous_channel(self):
+        self._set_channel(self._channel - self.device.channel_step)
+
+    def _set_volume(self, value: typ.Union[int, float]):
+        self.pending += 1
+        if self._enabled:
+            self._volume = value if value > 0 else 0
+
+    def _set_channel(self, value: typ.Union[int, float]):
+        self.pending += 1
+        if self._enabled:
+            self._channel = value if value >= 0 else 0
+
+    def flush(self):
+        device = self.device
+        if (self._volume, self._channel) != (device.volume, device.channel):
+            if not device.is_enabled:
+                device.enable()
+            device.set_state(self._volume, self._channel)
+        if device.is_enabled != self._enabled:
+            device.disable() if device.is_enabled else device.enable()
+        self.pending = 0
+
+
 class TV(Device):
     pass
 
@@ -100,6 +216,14 @@ class Radio(Device):
         self.channel_step = 0.2
 
 
+class StatefulTV(StatefulDevice, TV):
+    pass
+
+
+class StatefulRadio(StatefulDevice, Radio):
+    pass
+
+
 if __name__ == "__main__":
     tv = TV()
     tv_remote = Remote(tv)
@@ -115,6 +239,15 @@ if __name__ == "__main__":
     radio_remote.next_channel()
     radio_remote.mute()
 
+    print('-' * 30)
+    with BatchingRemote(TV()) as batching_remote:
+        batching_remote.toggle_power()
+        for _ in range(10):
+            batching_remote.volume_up()
+        batching_remote.mute()
+        batching_remote.next_channel()
+        print("Queued {} commands".format(batching_remote.pending))
+
 
 # ================ Output ================
 # Please turn on the TV first
@@ -125,3 +258,7 @@ if __name__ == "__main__":
 # Turning on Radio
 # Set Radio channel: 99.2
 # Set Radio volume: 0
+# ------------------------------
+# Queued 13 commands
+# Turning on TV
+# Set TV volume: 0, channel: 2
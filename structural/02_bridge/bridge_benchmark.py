@@ -0,0 +1,48 @@
+"""
+Потік з мільйона команд пульта: Remote, який одразу викликає пристрій,
+проти BatchingRemote, який застосовує лише підсумковий стан.
+"""
+import random
+import time
+from contextlib import redirect_stdout
+
+from bridge import AdvancedRemote, BatchingRemote, Radio
+
+N = 1000000
+COMMANDS = ("volume_up", "volume_up", "volume_down", "next_channel",
+            "previous_channel", "mute", "toggle_power")
+
+
+class NullWriter:
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def replay(remote_class: type, commands: list) -> Radio:
+    radio = Radio()
+    remote = remote_class(radio)
+    with redirect_stdout(NullWriter()):
+        start = time.perf_counter()
+        for command in commands:
+            getattr(remote, command)()
+        if isinstance(remote, BatchingRemote):
+            remote.flush()
+        elapsed = time.perf_counter() - start
+    print("{:<15} {:.3f}s".format(remote_class.__name__, elapsed))
+    return radio
+
+
+if __name__ == "__main__":
+    random.seed(42)
+    commands = [random.choice(COMMANDS) for _ in range(N)]
+    direct = replay(AdvancedRemote, commands)
+    batched = replay(BatchingRemote, commands)
+    print("same final state:", (direct.is_enabled, direct.volume, direct.channel) ==
+          (batched.is_enabled, batched.volume, batched.channel))
+
+
+# ================ Output ================
+# AdvancedRemote  2.435s
+# BatchingRemote  0.378s
+# same final state: True
@@ -0,0 +1,24 @@
+"""
+Ціна виклику set_volume на увімкненому пристрої:
+перевірка в обгортці when_turned_on проти StatefulDevice без перевірки.
+"""
+import timeit
+
+import bridge
+from bridge import TV, StatefulTV
+
+N = 1000000
+
+
+if __name__ == "__main__":
+    bridge.output = lambda text: None  # measure the call itself, not the printing
+    for device_class in (TV, StatefulTV):
+        device = device_class()
+        device.is_enabled = True
+        elapsed = min(timeit.repeat(lambda: device.set_volume(20), number=N, repeat=5))
+        print("{:<11} {:.0f} ns per call".format(device_class.__name__, elapsed / N * 1e9))
+
+
+# ================ Output ================
+# TV          1195 ns per call
+# StatefulTV  804 ns per call
@@ -0,0 +1,225 @@
+"""
+Журнал подій пристрою для Мосту.
+Кожна застосована до пристрою команда дописується в компактний журнал
+(код операції в array("B"), значення в array("d")),
+а кожні snapshot_every подій зберігається знімок стану.
+Стан на будь-який момент відновлюється з найближчого знімка
+та хвоста журналу після нього, без повторення всього журналу.
+
+Журнали можна масово зберігати у файл і завантажувати з нього.
+"""
+import bisect
+import struct
+import sys
+import typing as typ
+from array import array
+from collections import namedtuple
+
+from bridge import AdvancedRemote, Device, Radio, TV
+
+DeviceState = namedtuple("DeviceState", ("is_enabled", "volume", "channel"))
+
+ENABLE, DISABLE, SET_VOLUME, SET_CHANNEL = range(4)
+OPERATIONS = ("enable", "disable", "set_volume", "set_channel")
+INT_VALUE = 0x80
+
+MAGIC = b"DLOG"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBIQQ")
+SNAPSHOT = struct.Struct("<QBddB")
+
+
+def apply(state: DeviceState, operation: int, value: typ.Union[int, float]) -> DeviceState:
+    if operation == ENABLE:
+        return state._replace(is_enabled=True)
+    if operation == DISABLE:
+        return state._replace(is_enabled=False)
+    if operation == SET_VOLUME:
+        return state._replace(volume=value)
+    if operation == SET_CHANNEL:
+        return state._replace(channel=value)
+    raise ValueError("Unknown operation: {}".format(operation))
+
+
+class DeviceLog:
+
+    def __init__(self, state: DeviceState, snapshot_every: int = 1000):
+        self.snapshot_every = snapshot_every
+        self.operations = array("B")
+        self.values = array("d")
+        self.current = state
+        # (number of events before the snapshot, state), the first one is the initial state
+        self.snapshots = [(0, state)]  # type: typ.List[typ.Tuple[int, DeviceState]]
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def append(self, operation: int, value: typ.Union[int, float] = 0) -> None:
+        self.operations.append(operation | INT_VALUE if isinstance(value, int) else operation)
+        self.values.append(value)
+        self.current = apply(self.current, operation, value)
+        if len(self.operations) % self.snapshot_every == 0:
+            self.snapshots.append((len(self.operations), self.current))
+
+    def event(self, index: int) -> typ.Tuple[int, typ.Union[int, float]]:
+        code, value = self.operations[index], self.values[index]
+        if code & INT_VALUE:
+            return code & ~INT_VALUE, int(value)
+        return code, value
+
+    def events(self, start: int = 0, stop: typ.Optional[int] = None):
+        for index in range(start, len(self) if stop is None else stop):
+            yield self.event(index)
+
+    def state(self, index: typ.Optional[int] = None) -> DeviceState:
+        """State after the first index events, the current state by default"""
+        if index is None or index == len(self):
+            return self.current
+        if not 0 <= index <= len(self):
+            raise IndexError("Log has only {} events".format(len(self)))
+        position = bisect.bisect_right(self.snapshots, index, key=lambda snapshot: snapshot[0]) - 1
+        start, state = self.snapshots[position]
+        for operation, value in self.events(start, index):
+            state = apply(state, operation, value)
+        return state
+
+    def write(self, file: typ.BinaryIO) -> None:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, self.snapshot_every,
+                               len(self), len(self.snapshots)))
+        for start, state in self.snapshots:
+            int_flags = isinstance(state.volume, int) | isinstance(state.channel, int) << 1
+            file.write(SNAPSHOT.pack(start, state.is_enabled, state.volume, state.channel, int_flags))
+        values = self.values
+        if sys.byteorder == "big":
+            values = array("d", values)
+            values.byteswap()
+        file.write(self.operations.tobytes())
+        file.write(values.tobytes())
+
+    @classmethod
+    def read(cls, file: typ.BinaryIO) -> typ.Optional["DeviceLog"]:
+        header = file.read(HEADER.size)
+        if not header:
+            return None
+        magic, version, snapshot_every, events, snapshots = HEADER.unpack(header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Not a device log or unsupported version: {} {}".format(magic, version))
+
+        log = cls.__new__(cls)
+        log.snapshot_every = snapshot_every
+        log.snapshots = []
+        for _ in range(snapshots):
+            start, is_enabled, volume, channel, int_flags = SNAPSHOT.unpack(file.read(SNAPSHOT.size))
+            log.snapshots.append((start, DeviceState(
+                bool(is_enabled),
+                int(volume) if int_flags & 1 else volume,
+                int(channel) if int_flags & 2 else channel)))
+        log.operations = array("B")
+        log.operations.frombytes(file.read(events))
+        log.values = array("d")
+        log.values.frombytes(file.read(events * log.values.itemsize))
+        if sys.byteorder == "big":
+            log.values.byteswap()
+        start, log.current = log.snapshots[-1]
+        for operation, value in log.events(start):
+            log.current = apply(log.current, operation, value)
+        return log
+
+
+def dump(logs: typ.Iterable[DeviceLog], path: str) -> None:
+    with open(path, "wb") as file:
+        for log in logs:
+            log.write(file)
+
+
+def load(path: str) -> typ.List[DeviceLog]:
+    logs = []
+    with open(path, "rb") as file:
+        log = DeviceLog.read(file)
+        while log is not None:
+            logs.append(log)
+            log = DeviceLog.read(file)
+    return logs
+
+
+class LoggedDevice(Device):
+    snapshot_every = 1000
+
+    def __init__(self):
+        super().__init__()
+        self.log = DeviceLog(DeviceState(self.is_enabled, self.volume, self.channel), self.snapshot_every)
+
+    def enable(self):
+        super().enable()
+        self.log.append(ENABLE)
+
+    def disable(self):
+        super().disable()
+        self.log.append(DISABLE)
+
+    def set_volume(self, value: typ.Union[int, float]):
+        super().set_volume(value)
+        if self.is_enabled:
+            self.log.append(SET_VOLUME, self.volume)
+
+    def set_channel(self, value: typ.Union[int, float]):
+        super().set_channel(value)
+        if self.is_enabled:
+            self.log.append(SET_CHANNEL, self.channel)
+
+    def set_state(self, volume: typ.Union[int, float], channel: typ.Union[int, float]):
+        super().set_state(volume, channel)
+        if self.is_enabled:
+            self.log.append(SET_VOLUME, self.volume)
+            self.log.append(SET_CHANNEL, self.channel)
+
+
+class LoggedTV(LoggedDevice, TV):
+    pass
+
+
+class LoggedRadio(LoggedDevice, Radio):
+    pass
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    LoggedDevice.snapshot_every = 2
+    tv, radio = LoggedTV(), LoggedRadio()
+    for remote in (AdvancedRemote(tv), AdvancedRemote(radio)):
+        remote.toggle_power()
+        remote.volume_up()
+        remote.next_channel()
+        remote.mute()
+        remote.toggle_power()
+        remote.next_channel()
+
+    print([(OPERATIONS[operation], value) for operation, value in radio.log.events()])
+    print(radio.log.state(), radio.log.state(3), len(radio.log.snapshots))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "devices.log")
+        dump([tv.log, radio.log], path)
+        tv_log, radio_log = load(path)
+    print(tv_log.state() == tv.log.state(), radio_log.state(3) == radio.log.state(3),
+          list(radio_log.events()) == list(radio.log.events()))
+
+
+# ================ Output ================
+# Turning on LoggedTV
+# Set LoggedTV volume: 20
+# Set LoggedTV channel: 2
+# Set LoggedTV volume: 0
+# Turning off LoggedTV
+# Please turn on the LoggedTV first
+# Turning on LoggedRadio
+# Set LoggedRadio volume: 20
+# Set LoggedRadio channel: 99.2
+# Set LoggedRadio volume: 0
+# Turning off LoggedRadio
+# Please turn on the LoggedRadio first
+# [('enable', 0), ('set_volume', 20), ('set_channel', 99.2), ('set_volume', 0), ('disable', 0)]
+# DeviceState(is_enabled=False, volume=0, channel=99.2) DeviceState(is_enabled=True, volume=20, channel=99.2) 3
+# True True True
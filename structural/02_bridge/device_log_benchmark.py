@@ -0,0 +1,52 @@
+"""
+Відновлення стану пристрою з журналу на 1 000 000 подій:
+повне повторення журналу проти найближчого знімка і хвоста,
+розмір журналу в пам'яті та на диску, швидкість збереження і завантаження.
+"""
+import io
+import sys
+import time
+import timeit
+
+from device_log import SET_CHANNEL, SET_VOLUME, DeviceLog, DeviceState, apply
+
+N = 1000000
+
+
+def replay(log: DeviceLog, index: int) -> DeviceState:
+    state = log.snapshots[0][1]
+    for operation, value in log.events(0, index):
+        state = apply(state, operation, value)
+    return state
+
+
+if __name__ == "__main__":
+    log = DeviceLog(DeviceState(True, 10, 1), snapshot_every=1000)
+    for number in range(N):
+        log.append(SET_VOLUME if number % 2 else SET_CHANNEL, number % 100)
+
+    index = N - 500
+    assert replay(log, index) == log.state(index)
+    for name, rebuild in (("full replay", replay), ("snapshot+tail", DeviceLog.state)):
+        elapsed = min(timeit.repeat(lambda: rebuild(log, index), number=1, repeat=3))
+        print("{:<14} {:.2f} ms".format(name, elapsed * 1e3))
+
+    size = sys.getsizeof(log.operations) + sys.getsizeof(log.values)
+    print("in memory: {:.1f} bytes per event".format(size / N))
+
+    file = io.BytesIO()
+    start = time.perf_counter()
+    log.write(file)
+    saved = time.perf_counter()
+    file.seek(0)
+    loaded = DeviceLog.read(file)
+    print("on disk: {:.1f} bytes per event, save {:.1f} ms, load {:.1f} ms".format(
+        len(file.getvalue()) / N, (saved - start) * 1e3, (time.perf_counter() - saved) * 1e3))
+    assert loaded.state(index) == log.state(index) and loaded.state() == log.state()
+
+
+# ================ Output ================
+# full replay    2297.12 ms
+# snapshot+tail  1.22 ms
+# in memory: 9.2 bytes per event
+# on disk: 9.0 bytes per event, save 15.1 ms, load 16.3 ms
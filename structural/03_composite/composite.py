@@ -17,6 +17,8 @@
 import typing as typ
 from abc import ABC, abstractmethod
 
+output = print
+
 
 class Graphic(ABC):
 
@@ -39,7 +41,7 @@ class Dot(Graphic):
         self.y += y
 
     def draw(self) -> None:
-        print("Drew {} object. X={}, Y={}".format(
+        output("Drew {} object. X={}, Y={}".format(
             type(self).__name__, self.x, self.y))
 
 
@@ -58,7 +60,7 @@ class Circle(Dot):
         self._radius = value
 
     def draw(self) -> None:
-        print("Drew {} object. X={}, Y={}, Radius={}".format(
+        output("Drew {} object. X={}, Y={}, Radius={}".format(
             type(self).__name__, self.x, self.y, self.radius))
 
 
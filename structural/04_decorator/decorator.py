@@ -18,6 +18,8 @@
 The “Decorator Pattern” ≠ Python “decorators”!
 """
 
+output = print
+
 
 class Notification:
 
@@ -25,7 +27,7 @@ class Notification:
         self.text = text
 
     def send(self) -> str:
-        print("Sent through Email: {}".format(self.text))
+        output("Sent through Email: {}".format(self.text))
         return self.text
 
 
@@ -36,7 +38,7 @@ class TelegramNotification(Notification):
 
     def send(self) -> str:
         text = self.wrapped.send()
-        print("Sent through Telegram: {}".format(text))
+        output("Sent through Telegram: {}".format(text))
         return text
 
 
@@ -47,7 +49,7 @@ class SlackNotification(Notification):
 
     def send(self) -> str:
         text = self.wrapped.send()
-        print("Sent through Slack: {}".format(text))
+        output("Sent through Slack: {}".format(text))
         return text
 
 